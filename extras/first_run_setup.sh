@@ -38,6 +38,7 @@ echo "✓"
 printf "[3/5] Downloading language models (~50 MB)...  "
 .venv/bin/python -m spacy download en_core_web_md --quiet 2>/dev/null
 .venv/bin/python -m spacy download en_core_web_sm --quiet 2>/dev/null
+.venv/bin/python -m compileall -q main.py pii_buddy >/dev/null 2>&1
 echo "✓"
 
 # Step 4: Install rumps for menu bar support
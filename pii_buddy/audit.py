@@ -5,11 +5,17 @@ using pattern matching around existing tags and known person names.
 Runs locally with no external dependencies.
 """
 
+from __future__ import annotations
+
 import logging
 import re
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
 
-from .redactor import _make_initials
+from .detector import _compile
+from .redactor import _make_initials, _replace_all
 from .validation import _get_blocklist
 
 logger = logging.getLogger("pii_buddy")
@@ -24,78 +30,120 @@ _TITLE_RE = re.compile(
 _CAP_PHRASE_RE = re.compile(
     r"\b([A-Z][a-z]{2,}(?:\s+[A-Z][a-z]{2,}){1,2})\b"
 )
+# Literal-ish prefix every phrase match starts with — a much cheaper scan
+_CAP_PHRASE_START_RE = re.compile(r"[A-Z][a-z]{2,}\s+[A-Z]")
 
 # Possessive form: CapitalizedWord's
 _POSSESSIVE_RE = re.compile(r"\b([A-Z][a-z]{2,})'s\b")
 
-# Existing tag patterns (to skip already-tagged text)
-_NAME_TAG_RE = re.compile(r"<NAME\s+[A-Z]+\d*>")
-_TYPED_TAG_RE = re.compile(r"<<[A-Z]+_\d+>>")
+# Name joined to an existing tag: "<NAME XX> and Robert" / "Robert and <NAME XX>"
+_CONJ_AFTER_TAG_RE = re.compile(
+    r"<NAME\s+[A-Z]+\d*>\s+and\s+([A-Z][a-z]{2,}(?:\s+[A-Z][a-z]{2,})?)\b"
+)
+_CONJ_BEFORE_TAG_RE = re.compile(
+    r"\b([A-Z][a-z]{2,}(?:\s+[A-Z][a-z]{2,})?)\s+and\s+<NAME\s+[A-Z]+\d*>"
+)
+
+# Existing tag patterns (to skip already-tagged text). These are plain
+# ASCII, so they can use RE2 when it's installed; the finders above stay on
+# re because RE2's \b is ASCII-only and would split names like "Zoë".
+_NAME_TAG_RE = _compile(r"<NAME\s+[A-Z]+\d*>")
+_TYPED_TAG_RE = _compile(r"<<[A-Z]+_\d+>>")
+_ANY_TAG_RE = _compile(f"{_NAME_TAG_RE.pattern}|{_TYPED_TAG_RE.pattern}")
+
+# Every finder needs an uppercase letter followed by a lowercase one
+# (the shortest case is a title: "Dr Li")
+_AUDIT_PREFILTER_RE = re.compile(r"[A-Z][a-z]")
 
+# Tag spans as parallel (starts, ends) lists, sorted by start
+TagSpans = tuple[list[int], list[int]]
 
-def _collect_known_names(mapping: dict) -> set[str]:
+
+def _collect_known_names(mapping: dict) -> frozenset[str]:
     """Extract all known person surface forms from the mapping."""
+    return _known_names(frozenset(mapping.get("persons", {})))
+
+
+@lru_cache(maxsize=32)
+def _known_names(surfaces: frozenset[str]) -> frozenset[str]:
     names = set()
-    for surface in mapping.get("persons", {}):
+    for surface in surfaces:
         names.add(surface.lower())
         for part in surface.split():
             if len(part) >= 3:
                 names.add(part.lower())
-    return names
+    return frozenset(names)
+
 
+def _tag_spans(text: str) -> TagSpans:
+    """Locate every existing tag in text once, for _is_already_tagged()."""
+    starts, ends = [], []
+    for m in _ANY_TAG_RE.finditer(text):
+        starts.append(m.start())
+        ends.append(m.end())
+    return starts, ends
 
-def _is_already_tagged(text: str, start: int, end: int) -> bool:
-    """Check if position falls inside an existing tag."""
-    for m in _NAME_TAG_RE.finditer(text):
-        if m.start() <= start < m.end() or m.start() < end <= m.end():
-            return True
-    for m in _TYPED_TAG_RE.finditer(text):
-        if m.start() <= start < m.end() or m.start() < end <= m.end():
-            return True
-    return False
 
+def _is_already_tagged(spans: TagSpans, start: int, end: int) -> bool:
+    """Check if the start or end of a match falls inside an existing tag."""
+    starts, ends = spans
+    i = bisect_right(starts, start) - 1
+    if i >= 0 and start < ends[i]:
+        return True
+    i = bisect_left(starts, end) - 1
+    return i >= 0 and end <= ends[i]
 
-def _check_orphaned_conjunctions(text: str) -> list[str]:
+
+def _check_orphaned_conjunctions(text: str, spans: TagSpans | None = None) -> list[str]:
     """Find 'CapWord and <NAME XX>' or '<NAME XX> and CapWord' patterns."""
+    # Cheap substring checks rule out most texts without a regex pass
+    if "<NAME" not in text or "and" not in text:
+        return []
+    if spans is None:
+        spans = _tag_spans(text)
     findings = []
 
     # Pattern: <NAME XX> and CapitalizedWord
-    for m in re.finditer(
-        r"<NAME\s+[A-Z]+\d*>\s+and\s+([A-Z][a-z]{2,}(?:\s+[A-Z][a-z]{2,})?)\b",
-        text,
-    ):
+    for m in _CONJ_AFTER_TAG_RE.finditer(text):
         candidate = m.group(1)
-        if not _is_already_tagged(text, m.start(1), m.end(1)):
+        if not _is_already_tagged(spans, m.start(1), m.end(1)):
             findings.append(candidate)
 
     # Pattern: CapitalizedWord and <NAME XX>
-    for m in re.finditer(
-        r"\b([A-Z][a-z]{2,}(?:\s+[A-Z][a-z]{2,})?)\s+and\s+<NAME\s+[A-Z]+\d*>",
-        text,
-    ):
+    for m in _CONJ_BEFORE_TAG_RE.finditer(text):
         candidate = m.group(1)
-        if not _is_already_tagged(text, m.start(1), m.end(1)):
+        if not _is_already_tagged(spans, m.start(1), m.end(1)):
             findings.append(candidate)
 
     return findings
 
 
-def _check_title_prefixed(text: str) -> list[str]:
+def _check_title_prefixed(text: str, spans: TagSpans | None = None) -> list[str]:
     """Find 'Mr./Mrs./Dr./Prof.' followed by an untagged capitalized word."""
+    if spans is None:
+        spans = _tag_spans(text)
     findings = []
     for m in _TITLE_RE.finditer(text):
         name = m.group(2)
-        if not _is_already_tagged(text, m.start(2), m.end(2)):
+        if not _is_already_tagged(spans, m.start(2), m.end(2)):
             findings.append(name)
     return findings
 
 
-def _check_capitalized_phrases(text: str, blocklist: set[str]) -> list[str]:
+def _check_capitalized_phrases(
+    text: str, blocklist: set[str], spans: TagSpans | None = None
+) -> list[str]:
     """Find remaining 2-3 capitalized word sequences that aren't tagged or blocklisted."""
+    # No phrase can start before the first "Word Capital" pair
+    first = _CAP_PHRASE_START_RE.search(text)
+    if first is None:
+        return []
+    if spans is None:
+        spans = _tag_spans(text)
     findings = []
-    for m in _CAP_PHRASE_RE.finditer(text):
+    for m in _CAP_PHRASE_RE.finditer(text, first.start()):
         phrase = m.group(1)
-        if _is_already_tagged(text, m.start(), m.end()):
+        if _is_already_tagged(spans, m.start(), m.end()):
             continue
         if phrase.lower() in blocklist:
             continue
@@ -109,12 +157,18 @@ def _check_capitalized_phrases(text: str, blocklist: set[str]) -> list[str]:
     return findings
 
 
-def _check_possessive_references(text: str, known_names: set[str]) -> list[str]:
+def _check_possessive_references(
+    text: str, known_names: set[str], spans: TagSpans | None = None
+) -> list[str]:
     """Find CapWord's where CapWord matches a known first/last name."""
+    if not known_names or "'s" not in text:
+        return []
+    if spans is None:
+        spans = _tag_spans(text)
     findings = []
     for m in _POSSESSIVE_RE.finditer(text):
         word = m.group(1)
-        if word.lower() in known_names and not _is_already_tagged(text, m.start(1), m.end(1)):
+        if word.lower() in known_names and not _is_already_tagged(spans, m.start(1), m.end(1)):
             findings.append(word)
     return findings
 
@@ -124,22 +178,26 @@ def audit_redacted(redacted_text: str, mapping: dict) -> tuple[str, dict]:
 
     Returns (patched_text, updated_mapping).
     """
+    if not _AUDIT_PREFILTER_RE.search(redacted_text):
+        return redacted_text, mapping
+
     blocklist = _get_blocklist()
     known_names = _collect_known_names(mapping)
 
-    # Collect all findings
-    all_findings: list[str] = []
-    all_findings.extend(_check_orphaned_conjunctions(redacted_text))
-    all_findings.extend(_check_title_prefixed(redacted_text))
-    all_findings.extend(_check_capitalized_phrases(redacted_text, blocklist))
-    all_findings.extend(_check_possessive_references(redacted_text, known_names))
+    spans = _tag_spans(redacted_text)
 
-    # Deduplicate
+    # Collect findings, deduplicated and blocklist-filtered as they arrive
     seen = set()
     unique_findings = []
-    for f in all_findings:
-        if f.lower() not in seen and f.lower() not in blocklist:
-            seen.add(f.lower())
+    for f in chain(
+        _check_orphaned_conjunctions(redacted_text, spans),
+        _check_title_prefixed(redacted_text, spans),
+        _check_capitalized_phrases(redacted_text, blocklist, spans),
+        _check_possessive_references(redacted_text, known_names, spans),
+    ):
+        key = f.lower()
+        if key not in seen and key not in blocklist:
+            seen.add(key)
             unique_findings.append(f)
 
     if not unique_findings:
@@ -157,8 +215,13 @@ def audit_redacted(redacted_text: str, mapping: dict) -> tuple[str, dict]:
             n = int(pm.group(2)) if pm.group(2) else 1
             initials_max[pm.group(1)] = max(initials_max[pm.group(1)], n)
 
-    patched = redacted_text
-    applied = 0
+    # Lowercased word -> first person surface containing it
+    surface_for_part: dict[str, str] = {}
+    for surface in persons:
+        for part in surface.lower().split():
+            surface_for_part.setdefault(part, surface)
+
+    replacements: list[tuple[str, str]] = []  # (finding, tag)
 
     for pii_text in unique_findings:
         # Skip if already a tag or inside a tag
@@ -168,16 +231,12 @@ def audit_redacted(redacted_text: str, mapping: dict) -> tuple[str, dict]:
         if pii_text in tags.values():
             continue
         # Must appear in text
-        if pii_text not in patched:
+        if pii_text not in redacted_text:
             continue
 
         # Check if this name maps to an existing person's tag
-        existing_tag = None
-        for surface, tag in persons.items():
-            surface_parts = surface.lower().split()
-            if pii_text.lower() in surface_parts:
-                existing_tag = tag
-                break
+        surface = surface_for_part.get(pii_text.lower())
+        existing_tag = persons[surface] if surface is not None else None
 
         if existing_tag:
             tag = existing_tag
@@ -190,14 +249,16 @@ def audit_redacted(redacted_text: str, mapping: dict) -> tuple[str, dict]:
                 tag = f"<NAME {initials}>"
 
         tags[tag] = pii_text
+        if pii_text not in persons:
+            for part in pii_text.lower().split():
+                surface_for_part.setdefault(part, pii_text)
         persons[pii_text] = tag
+        replacements.append((pii_text, tag))
 
-        pattern = re.compile(re.escape(pii_text), re.IGNORECASE)
-        patched = pattern.sub(tag, patched)
-        applied += 1
-
-    if applied:
-        logger.info(f"  Audit: {applied} additional redactions applied")
+    # One left-to-right pass for all findings ("Amanda Chen" wins over "Chen")
+    patched = _replace_all(redacted_text, replacements, re.IGNORECASE)
+    if replacements:
+        logger.info(f"  Audit: {len(replacements)} additional redactions applied")
 
     updated_mapping = dict(mapping)
     updated_mapping["tags"] = tags
@@ -0,0 +1,634 @@
+"""Command-line interface — argument parsing and dispatch for main.py."""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+
+USER_BLOCKLIST_TEMPLATE = """\
+# Your personal blocklist — terms here will NEVER be treated as a person's name.
+# One per line, case-insensitive. Lines starting with # are comments.
+#
+# This file is yours and will never be overwritten by updates.
+# Add company names, product names, or any terms that get incorrectly redacted.
+#
+# Examples:
+# My Company Name
+# Specific Product Name
+# Internal Project Codename
+"""
+
+
+logger = logging.getLogger("pii_buddy")
+_logging_ready = False
+
+
+def setup_logging():
+    """Send pii_buddy log records to stdout. Safe to call more than once."""
+    global _logging_ready
+    if _logging_ready:
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(asctime)s  %(message)s", datefmt="%H:%M:%S"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    _logging_ready = True
+
+
+def ensure_dirs():
+    import pii_buddy.config as cfg
+
+    for d in cfg.ALL_DIRS:
+        d.mkdir(parents=True, exist_ok=True)
+    # Seed user blocklist if it doesn't exist
+    user_bl = cfg.USER_BLOCKLISTS_DIR / "user_blocklist.txt"
+    if not user_bl.exists():
+        user_bl.write_text(USER_BLOCKLIST_TEMPLATE, encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="PII Buddy — redact PII from documents"
+    )
+    parser.add_argument(
+        "--once",
+        nargs="+",
+        metavar="FILE",
+        help="Process one or more files and exit (instead of watching)",
+    )
+    parser.add_argument(
+        "--restore",
+        nargs=2,
+        metavar=("REDACTED_FILE", "MAPPING_FILE"),
+        help="Restore PII into a redacted file using its mapping",
+    )
+    parser.add_argument(
+        "--paste",
+        action="store_true",
+        help="Read text from stdin (paste + Ctrl+D), print redacted output",
+    )
+    parser.add_argument(
+        "--clipboard",
+        action="store_true",
+        help="Read from clipboard, redact, write result back to clipboard",
+    )
+    parser.add_argument(
+        "--dir",
+        metavar="PATH",
+        help="Override the base directory (default: ~/PII_Buddy)",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Download latest blocklists from GitHub",
+    )
+    parser.add_argument(
+        "--update-app",
+        action="store_true",
+        help="Update PII Buddy to the latest version via git pull",
+    )
+    parser.add_argument(
+        "--menubar",
+        action="store_true",
+        help="Launch Mac menu bar app (requires: pip install rumps)",
+    )
+    parser.add_argument(
+        "--credits",
+        action="store_true",
+        help="Check your current credit balance",
+    )
+    parser.add_argument(
+        "--buy",
+        action="store_true",
+        help="Open browser to purchase credits",
+    )
+    # Output format flags
+    parser.add_argument(
+        "--same-format",
+        action="store_true",
+        help="Output matches input format (PDF→PDF, DOCX→DOCX)",
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Replace input file with redacted version (backs up original)",
+    )
+    parser.add_argument(
+        "--text-output",
+        action="store_true",
+        help="Also produce a .txt version alongside formatted output",
+    )
+    parser.add_argument(
+        "--tag",
+        metavar="TAG",
+        default=None,
+        help="Customize filename prefix (default: PII_FREE). Empty string = no prefix, appends _redacted",
+    )
+    parser.add_argument(
+        "--keep-name",
+        action="store_true",
+        help="Keep original filename (output goes to output/ folder)",
+    )
+    # Verify flags
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Enable cloud verification after local redaction",
+    )
+    parser.add_argument(
+        "--verify-key",
+        metavar="KEY",
+        default=None,
+        help="PII Buddy Verify API key",
+    )
+    parser.add_argument(
+        "--verify-endpoint",
+        metavar="URL",
+        default=None,
+        help="Override verify API endpoint (default: https://api.piibuddy.com/v1)",
+    )
+    parser.add_argument(
+        "--verify-confidence",
+        metavar="N",
+        type=float,
+        default=None,
+        help="Minimum confidence threshold for verify findings (default: 0.7)",
+    )
+    # Feedback flags
+    parser.add_argument(
+        "--rate",
+        type=int,
+        choices=[1, 2, 3, 4, 5],
+        metavar="N",
+        help="Rate the quality of the last redaction (1-5 stars)",
+    )
+    parser.add_argument(
+        "--feedback",
+        metavar="COMMENT",
+        help="Submit feedback about detection quality (describe patterns, not actual PII)",
+    )
+    # Subscribe
+    parser.add_argument(
+        "--subscribe",
+        metavar="EMAIL",
+        help="Subscribe to PII Buddy product updates",
+    )
+    # Detection flags
+    parser.add_argument(
+        "--model",
+        choices=["sm", "md", "lg", "trf"],
+        default=None,
+        help="spaCy model: sm (fastest), md (default), lg, trf (most accurate)",
+    )
+    parser.add_argument(
+        "--gpu",
+        action="store_true",
+        help="Run spaCy on the GPU if one is available",
+    )
+    parser.add_argument(
+        "--regex-only",
+        action="store_true",
+        help="Skip spaCy: redact structured PII (emails, phones, SSNs...) only, not names",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Worker processes for spaCy when batching files (default: half the CPU cores)",
+    )
+    # Watch flags
+    parser.add_argument(
+        "--watch-poll",
+        action="store_true",
+        help="Poll the input folder instead of using OS file events (for network drives)",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        metavar="SECONDS",
+        type=float,
+        default=None,
+        help="Seconds between polls; implies --watch-poll (default: 1.0)",
+    )
+    # Audit flags
+    parser.add_argument(
+        "--no-audit",
+        action="store_true",
+        help="Disable structural self-audit (Pass 2)",
+    )
+    # OpenRouter flags
+    parser.add_argument(
+        "--openrouter",
+        action="store_true",
+        help="Enable OpenRouter LLM verification (Pass 3)",
+    )
+    parser.add_argument(
+        "--openrouter-key",
+        metavar="KEY",
+        default=None,
+        help="OpenRouter API key",
+    )
+    parser.add_argument(
+        "--openrouter-model",
+        metavar="ID",
+        default=None,
+        help="OpenRouter model (default: meta-llama/llama-3.1-8b-instruct:free)",
+    )
+    args = parser.parse_args()
+
+    if args.menubar:
+        # The menu bar app configures its own logging
+        from pii_buddy.menubar import main as menubar_main
+        menubar_main()
+        return
+
+    setup_logging()
+
+    # --buy needs neither the data directories nor settings
+    if args.buy:
+        import webbrowser
+        purchase_url = "https://piibuddy.com"
+        logger.info(f"Opening {purchase_url} ...")
+        webbrowser.open(purchase_url)
+        return
+
+    import pii_buddy.config as cfg
+
+    # Override base dir if requested
+    if args.dir:
+        cfg.BASE_DIR = Path(args.dir)
+        cfg.INPUT_DIR = cfg.BASE_DIR / "input"
+        cfg.OUTPUT_DIR = cfg.BASE_DIR / "output"
+        cfg.MAPPINGS_DIR = cfg.BASE_DIR / "mappings"
+        cfg.ORIGINALS_DIR = cfg.BASE_DIR / "originals"
+        cfg.LOGS_DIR = cfg.BASE_DIR / "logs"
+        cfg.USER_BLOCKLISTS_DIR = cfg.BASE_DIR / "blocklists"
+        cfg.FEEDBACK_DIR = cfg.BASE_DIR / "feedback"
+        cfg.ALL_DIRS = [
+            cfg.INPUT_DIR, cfg.OUTPUT_DIR, cfg.MAPPINGS_DIR, cfg.ORIGINALS_DIR,
+            cfg.LOGS_DIR, cfg.USER_BLOCKLISTS_DIR, cfg.FEEDBACK_DIR,
+        ]
+
+    ensure_dirs()
+
+    # Resolve settings: CLI flags > settings.conf > hardcoded defaults
+    from pii_buddy.settings import resolve_settings, seed_settings_file
+
+    base_dir = cfg.BASE_DIR
+    seed_settings_file(base_dir)
+
+    settings = resolve_settings(
+        base_dir=base_dir,
+        cli_same_format=args.same_format,
+        cli_overwrite=args.overwrite,
+        cli_text_output=args.text_output,
+        cli_tag=args.tag,
+        cli_keep_name=args.keep_name,
+        cli_verify=args.verify,
+        cli_verify_key=args.verify_key,
+        cli_verify_endpoint=args.verify_endpoint,
+        cli_verify_confidence=args.verify_confidence,
+        cli_no_audit=args.no_audit,
+        cli_openrouter=args.openrouter,
+        cli_openrouter_key=args.openrouter_key,
+        cli_openrouter_model=args.openrouter_model,
+        cli_model=args.model,
+        cli_gpu=args.gpu,
+        cli_regex_only=args.regex_only,
+        cli_jobs=args.jobs,
+        cli_watch_poll=args.watch_poll,
+        cli_watch_interval=args.watch_interval,
+    )
+
+    # Apply resolved paths back to config module (for code that reads config directly)
+    cfg.INPUT_DIR = settings.input_dir
+    cfg.OUTPUT_DIR = settings.output_dir
+
+    if args.credits:
+        try:
+            from pii_buddy.verify_client import VerifyClient, VerifyError
+        except ImportError:
+            logger.error("Cloud verification is a premium feature. Visit https://piibuddy.com for details.")
+            sys.exit(1)
+        if not settings.verify_api_key:
+            logger.error("No API key configured. Set one in settings.conf [verify] api_key or use --verify-key.")
+            sys.exit(1)
+        client = VerifyClient(
+            api_key=settings.verify_api_key,
+            endpoint=settings.verify_endpoint,
+        )
+        try:
+            usage = client.check_usage()
+            credits = usage.get("credits_remaining", "unknown")
+            used = usage.get("credits_used", "unknown")
+            plan = usage.get("plan", "unknown")
+            logger.info(f"Credits remaining: {credits}")
+            logger.info(f"Credits used:      {used}")
+            logger.info(f"Plan:              {plan}")
+        except VerifyError as e:
+            logger.error(f"Failed to check credits: {e}")
+            sys.exit(1)
+        return
+
+    if args.update_app:
+        import subprocess
+
+        app_dir = Path(__file__).resolve().parent.parent
+        logger.info(f"Updating PII Buddy in {app_dir}...")
+
+        # Check for uncommitted changes
+        status = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=app_dir, capture_output=True, text=True,
+        )
+        if status.stdout.strip():
+            logger.warning("You have uncommitted changes. Stashing them first...")
+            subprocess.run(["git", "stash"], cwd=app_dir)
+
+        # Pull latest
+        result = subprocess.run(
+            ["git", "pull", "--rebase"],
+            cwd=app_dir, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            logger.error(f"git pull failed:\n{result.stderr}")
+            sys.exit(1)
+
+        output = result.stdout.strip()
+        if "Already up to date" in output:
+            logger.info("Already up to date.")
+        else:
+            logger.info(output)
+            logger.info("Update complete. Restart PII Buddy to use the new version.")
+        return
+
+    if args.update:
+        from pii_buddy.updater import update_blocklists
+        from pii_buddy.validation import reload_blocklist
+
+        updated = update_blocklists()
+        if updated:
+            reload_blocklist()
+            logger.info("Blocklist update complete.")
+        return
+
+    if args.subscribe:
+        import re as _re
+
+        email = args.subscribe.strip()
+        if not _re.match(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", email):
+            logger.error("Invalid email format.")
+            sys.exit(1)
+        # Store locally until api.piibuddy.com is live
+        subscribe_dir = cfg.BASE_DIR / "feedback"
+        subscribe_dir.mkdir(parents=True, exist_ok=True)
+        subscribe_file = subscribe_dir / "pending_subscriptions.txt"
+        # Check for duplicates — compare whole emails (first column), not
+        # substrings, so a@x.com isn't mistaken for an existing ba@x.com
+        already = False
+        if subscribe_file.exists():
+            with open(subscribe_file, encoding="utf-8") as f:
+                already = any(line.split("\t", 1)[0] == email for line in f)
+        if already:
+            logger.info(f"Already subscribed: {email}")
+        else:
+            with open(subscribe_file, "a", encoding="utf-8") as f:
+                from datetime import datetime
+                f.write(f"{email}\tcli\t{datetime.now().isoformat()}\n")
+            logger.info(f"Subscribed! You'll receive product updates at {email}")
+            logger.info("(Subscription will sync when the update server is live.)")
+        return
+
+    if args.rate or args.feedback:
+        from pii_buddy.feedback import record_rating
+
+        if args.rate:
+            record_rating(
+                rating=args.rate,
+                comment=args.feedback or "",
+                source="cli",
+            )
+            logger.info(f"Thanks for rating PII Buddy {'*' * args.rate}{'.' * (5 - args.rate)}")
+        elif args.feedback:
+            record_rating(
+                rating=0,
+                comment=args.feedback,
+                source="cli",
+            )
+            logger.info("Feedback recorded. Thank you!")
+        return
+
+    if args.paste or args.clipboard:
+        from datetime import datetime
+        from pii_buddy.detector import detect_pii
+        from pii_buddy.mapping import save_mapping
+        from pii_buddy.redactor import redact
+
+        if not settings.regex_only:
+            # Load spaCy while we wait on the clipboard / pasted input
+            from pii_buddy.detector import prewarm_nlp_async
+            prewarm_nlp_async(settings.spacy_model, settings.gpu)
+
+        if args.clipboard:
+            from pii_buddy.clipboard import read_clipboard
+            text = read_clipboard()
+            if not text.strip():
+                logger.error("Clipboard is empty.")
+                sys.exit(1)
+            logger.info(f"Read {len(text)} chars from clipboard.")
+        else:
+            logger.info("Paste text below, then press Ctrl+D when done:\n")
+            # Raw bytes: skip the incremental text-mode decode and don't
+            # depend on the locale's encoding
+            raw = sys.stdin.buffer.read()
+            if not raw.strip():
+                logger.error("No text received.")
+                sys.exit(1)
+            from pii_buddy.extractor import normalize_newlines
+            text = normalize_newlines(raw.decode("utf-8", errors="replace"))
+
+        entities = detect_pii(
+            text,
+            model=settings.spacy_model,
+            gpu=settings.gpu,
+            regex_only=settings.regex_only,
+        )
+        logger.info(f"Found {len(entities)} PII entities.")
+        redacted_text, mapping = redact(text, entities)
+
+        # Pass 2: Structural audit (on by default)
+        pre_audit_tags = len(mapping.get("tags", {}))
+        if settings.audit_enabled:
+            from pii_buddy.audit import audit_redacted
+            redacted_text, mapping = audit_redacted(redacted_text, mapping)
+
+        # Pass 3: OpenRouter LLM verification (optional, premium)
+        if settings.openrouter_enabled and settings.openrouter_api_key:
+            try:
+                from pii_buddy.openrouter_verifier import openrouter_verify_and_patch
+                redacted_text, mapping = openrouter_verify_and_patch(
+                    redacted_text, mapping, settings
+                )
+            except ImportError:
+                logger.warning("OpenRouter verification requires premium modules. Visit https://piibuddy.com")
+
+        # Upsell: if audit found extra PII and cloud verify is off
+        post_tags = len(mapping.get("tags", {}))
+        extra_found = post_tags - pre_audit_tags
+        if extra_found > 0 and not (settings.verify_enabled and settings.verify_api_key):
+            logger.info(
+                f"  Audit found {extra_found} additional items. "
+                "For deeper detection, try PII Buddy Verify: piibuddy.com"
+            )
+
+        # Pass 4: Cloud verification (optional, premium)
+        if settings.verify_enabled and settings.verify_api_key:
+            try:
+                from pii_buddy.verifier import verify_and_patch
+                redacted_text, mapping = verify_and_patch(
+                    redacted_text, mapping, settings
+                )
+            except ImportError:
+                logger.warning("Cloud verification requires premium modules. Visit https://piibuddy.com")
+
+        # Save mapping file
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        mapping["metadata"] = {
+            "source": "clipboard" if args.clipboard else "stdin",
+            "processed_at": now.isoformat(),
+            "entities_found": len(entities),
+        }
+        mapping_path = cfg.MAPPINGS_DIR / f"pasted_{timestamp}.map.json"
+        save_mapping(mapping, mapping_path)
+        logger.info(f"Mapping saved: {mapping_path.name}")
+
+        if args.clipboard:
+            from pii_buddy.clipboard import write_clipboard
+            write_clipboard(redacted_text)
+            logger.info("Redacted text copied to clipboard. Paste it anywhere.")
+        else:
+            print("\n" + "=" * 50)
+            print("REDACTED OUTPUT:")
+            print("=" * 50)
+            print(redacted_text)
+
+        logger.info("")
+        logger.info("How did we do? Rate this redaction:")
+        logger.info("  ./run.sh --rate 1-5 [--feedback \"what we missed\"]")
+
+        return
+
+    if args.restore:
+        from pii_buddy.mapping import load_mapping
+        from pii_buddy.restorer import restore_file
+
+        redacted_path = Path(args.restore[0])
+        mapping_path = Path(args.restore[1])
+
+        # Read mapping to find the original tag pattern
+        mapping_data = load_mapping(mapping_path) if mapping_path.exists() else None
+        original_file = (mapping_data or {}).get("metadata", {}).get("original_file", "")
+
+        # Build restored filename — strip the tag prefix, add RESTORED_
+        restored_name = redacted_path.name
+        prefixes = tuple(f"{tag}_" for tag in (settings.tag, "PII_FREE") if tag)
+        for prefix in prefixes:
+            if restored_name.startswith(prefix):
+                restored_name = restored_name[len(prefix):]
+                break
+        restored_name = f"RESTORED_{restored_name}"
+
+        out_path = redacted_path.parent / restored_name
+        restore_file(redacted_path, out_path, mapping_path, mapping_data)
+        logger.info(f"Restored: {out_path}")
+        return
+
+    if args.once:
+        from pii_buddy.watcher import process_files
+
+        if not settings.regex_only:
+            from pii_buddy.detector import prewarm_nlp_async
+            prewarm_nlp_async(settings.spacy_model, settings.gpu)
+
+        filepaths = [Path(f) for f in args.once]
+        missing = [f for f in filepaths if not f.exists()]
+        for filepath in missing:
+            logger.error(f"File not found: {filepath.absolute()}")
+        if missing:
+            sys.exit(1)
+
+        # Each file is staged, backed up and mapped under its own name, so
+        # two inputs sharing one would overwrite each other
+        from collections import Counter
+
+        name_counts = Counter(filepath.name for filepath in filepaths)
+        duplicates = [name for name, count in name_counts.items() if count > 1]
+        for name in duplicates:
+            logger.error(f"More than one file named {name!r} — run them separately")
+        if duplicates:
+            sys.exit(1)
+
+        if settings.overwrite:
+            # Overwrite mode: process in place, no copy needed
+            targets = filepaths
+        else:
+            # Put each file in the input dir if not already there —
+            # a hard link when possible, so no bytes are copied
+            import os
+            import shutil
+
+            targets = []
+            for filepath in filepaths:
+                dest = cfg.INPUT_DIR / filepath.name
+                if not (dest.exists() and os.path.samefile(filepath, dest)):
+                    # Replace, never write into, a stale dest: it may be a
+                    # hard link to some other file of the user's
+                    dest.unlink(missing_ok=True)
+                    try:
+                        os.link(filepath, dest)
+                    except OSError:
+                        shutil.copy2(str(filepath), str(dest))
+                targets.append(dest)
+
+        # All files share one parser, settings load and spaCy batch
+        results = process_files(targets, settings)
+        sys.exit(0 if all(results) else 1)
+
+    # Default: watch mode
+    from pii_buddy.watcher import watch
+
+    if not settings.regex_only:
+        # Have the model ready before the first file lands
+        from pii_buddy.detector import prewarm_nlp_async
+        prewarm_nlp_async(settings.spacy_model, settings.gpu)
+
+    logger.info("=" * 50)
+    logger.info("PII Buddy")
+    logger.info("=" * 50)
+    logger.info(f"Input:    {cfg.INPUT_DIR}")
+    logger.info(f"Output:   {cfg.OUTPUT_DIR}")
+    logger.info(f"Mappings: {cfg.MAPPINGS_DIR}")
+    if settings.output_format == "same":
+        logger.info(f"Format:   same as input")
+    if settings.overwrite:
+        logger.info(f"Mode:     overwrite (originals backed up)")
+    if settings.tag != "PII_FREE":
+        logger.info(f"Tag:      {settings.tag!r}")
+    if settings.regex_only:
+        logger.info(f"Detection: regex only (names not redacted)")
+    elif settings.spacy_model:
+        logger.info(f"Model:    {settings.spacy_model}{' (GPU)' if settings.gpu else ''}")
+    if not settings.audit_enabled:
+        logger.info(f"Audit:    disabled")
+    if settings.openrouter_enabled:
+        logger.info(f"OpenRouter: enabled ({settings.openrouter_model})")
+    if settings.verify_enabled:
+        logger.info(f"Verify:   enabled ({settings.verify_endpoint})")
+    logger.info("")
+    watch(cfg.INPUT_DIR, settings)
+
+
+if __name__ == "__main__":
+    main()
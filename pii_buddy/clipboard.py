@@ -0,0 +1,49 @@
+"""Read and write the macOS clipboard.
+
+Talks to NSPasteboard in-process when PyObjC is available, and falls back
+to the pbpaste/pbcopy command-line tools otherwise.
+"""
+
+import os
+import subprocess
+from functools import lru_cache
+
+
+def _utf8_env() -> dict:
+    """Environment telling pbcopy/pbpaste the pipe carries UTF-8.
+
+    Without a UTF-8 locale (e.g. when started by launchd) they fall back
+    to a legacy encoding and mangle non-ASCII text.
+    """
+    return {**os.environ, "LC_CTYPE": "UTF-8"}
+
+
+@lru_cache(maxsize=1)
+def _appkit():
+    """Return the AppKit module, or None if PyObjC isn't installed."""
+    try:
+        import AppKit
+        return AppKit
+    except ImportError:
+        return None
+
+
+def read_clipboard() -> str:
+    """Return the clipboard's plain-text contents ("" if none)."""
+    appkit = _appkit()
+    if appkit is not None:
+        pasteboard = appkit.NSPasteboard.generalPasteboard()
+        return pasteboard.stringForType_(appkit.NSPasteboardTypeString) or ""
+    result = subprocess.run(["pbpaste"], capture_output=True, env=_utf8_env())
+    return result.stdout.decode("utf-8", errors="replace")
+
+
+def write_clipboard(text: str) -> None:
+    """Replace the clipboard's contents with plain text."""
+    appkit = _appkit()
+    if appkit is not None:
+        pasteboard = appkit.NSPasteboard.generalPasteboard()
+        pasteboard.clearContents()
+        pasteboard.setString_forType_(text, appkit.NSPasteboardTypeString)
+        return
+    subprocess.run(["pbcopy"], input=text.encode("utf-8"), env=_utf8_env())
@@ -23,6 +23,14 @@ ORIGINALS_RETENTION_HOURS = 24
 # Settings file
 SETTINGS_FILENAME = "settings.conf"
 
+# spaCy pipelines selectable with --model / [detection] model
+SPACY_MODELS = {
+    "sm": "en_core_web_sm",
+    "md": "en_core_web_md",
+    "lg": "en_core_web_lg",
+    "trf": "en_core_web_trf",
+}
+
 # GitHub repo for blocklist updates
 GITHUB_REPO = "rahhbster/pii_buddy"
 GITHUB_BRANCH = "main"
@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+import logging
+import os
 import re
+import sys
+import threading
+from bisect import bisect_right
 from dataclasses import dataclass, field
+from functools import lru_cache
 
-from .validation import validate_entities
+from .config import SPACY_MODELS
+from .validation import _HAS_DIGIT_RE, _NON_NAME_CHAR_RE, validate_entities
 
+try:
+    import re2  # optional: google-re2, guaranteed linear-time matching
+except ImportError:
+    re2 = None
 
-@dataclass
+logger = logging.getLogger("pii_buddy")
+
+
+# Slotted dataclasses (3.10+) drop the per-instance __dict__; documents
+# produce many candidate entities
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
 class PIIEntity:
     text: str
     label: str
@@ -19,11 +35,30 @@ class PIIEntity:
 
 # --- Regex patterns for structured PII ---
 
-EMAIL_RE = re.compile(
+
+def _compile(pattern: str, flags: int = 0):
+    """Compile with RE2 when it's installed, otherwise with stdlib re.
+
+    RE2 can't backtrack, so crafted input (e.g. a huge pasted blob) can't
+    make a pattern go quadratic. Patterns RE2 can't express (lookarounds)
+    stay on re.
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.log_errors = False
+        options.case_sensitive = not flags & re.IGNORECASE
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+
+EMAIL_RE = _compile(
     r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
 )
 
-PHONE_RE = re.compile(
+PHONE_RE = _compile(
     r"(?<!\d)"
     r"(?:\+?1[-.\s]?)?"
     r"(?:\(?\d{3}\)?[-.\s]?)"
@@ -31,15 +66,21 @@ PHONE_RE = re.compile(
     r"(?!\d)"
 )
 
-SSN_RE = re.compile(
+# PHONE_RE's lookarounds keep it on stdlib re, where it's the slowest
+# pattern to sweep over a whole document. Every phone number lies inside
+# a run like this (bounded by non-digits, so the lookarounds see the same
+# neighbours), so only those runs get the full pattern.
+_PHONE_RUN_RE = re.compile(r"[\d\s().+-]{10,}")
+
+SSN_RE = _compile(
     r"\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b"
 )
 
-URL_RE = re.compile(
+URL_RE = _compile(
     r"https?://[^\s<>\"']+|www\.[^\s<>\"']+"
 )
 
-DOB_RE = re.compile(
+DOB_RE = _compile(
     r"\b(?:"
     r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}"
     r"|(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|"
@@ -49,7 +90,7 @@ DOB_RE = re.compile(
     re.IGNORECASE,
 )
 
-ID_NUMBER_RE = re.compile(
+ID_NUMBER_RE = _compile(
     r"\b(?:"
     r"[A-Z]{1,2}\d{6,8}"
     r"|[A-Z]{2,4}-[A-Z]{1,4}-\d{5,10}"
@@ -57,7 +98,7 @@ ID_NUMBER_RE = re.compile(
     r")\b"
 )
 
-ADDRESS_RE = re.compile(
+ADDRESS_RE = _compile(
     r"\b\d{1,6}\s+"
     r"(?:[A-Z][a-z]+\s+){1,4}"
     r"(?:St(?:reet)?|Ave(?:nue)?|Blvd|Boulevard|Dr(?:ive)?|Ln|Lane|"
@@ -69,7 +110,7 @@ ADDRESS_RE = re.compile(
     re.IGNORECASE,
 )
 
-ZIP_RE = re.compile(r"\b\d{5}(?:-\d{4})?\b")
+ZIP_RE = _compile(r"\b\d{5}(?:-\d{4})?\b")
 
 REGEX_PATTERNS = [
     (EMAIL_RE, "EMAIL"),
@@ -81,41 +122,120 @@ REGEX_PATTERNS = [
     (ADDRESS_RE, "ADDRESS"),
 ]
 
+
+def _finditer_phones(text: str):
+    """PHONE_RE.finditer(), run only over the digit/separator runs."""
+    for run in _PHONE_RUN_RE.finditer(text):
+        yield from PHONE_RE.finditer(text, run.start(), run.end())
+
+
+# (finditer, label) pairs that _detect_regex runs, in REGEX_PATTERNS order
+_REGEX_FINDERS = tuple(
+    (_finditer_phones if pattern is PHONE_RE else pattern.finditer, label)
+    for pattern, label in REGEX_PATTERNS
+)
+
 _VAGUE_DATE_RE = re.compile(
     r"(?:years?|months?|weeks?|days?|present|current|today|now|ago)",
     re.IGNORECASE,
 )
 
+# Header heuristics
+_ALLCAPS_HEADER_RE = re.compile(
+    r"^([A-Z][A-Z]+(?:\s+[A-Z][A-Z]+){0,3})\s*$", re.MULTILINE
+)
+_HEADER_TRAILER_RE = re.compile(r'\s*[\(\[].+$')
+_HEADER_AND_RE = re.compile(r'\s+and\s+', re.IGNORECASE)
+
+# Document type cues (matched against the lowercased sample unless noted)
+_INTERVIEWER_RE = re.compile(
+    r'\b(?:interviewer|interviewee|moderator|speaker\s*\d+)\s*:'
+)
+_LEADING_NAME_RE = re.compile(r'^\s*[A-Z][a-z]+\s*:', re.MULTILINE)  # original case
+_QA_RE = re.compile(r'\b(?:q:|a:|question:|answer:)')
+_RESUME_KW_RE = re.compile(r'\b(?:resume|curriculum vitae|cv)\b')
+_RESUME_SEC_RE = re.compile(
+    r'\b(?:professional summary|work experience|education)\b'
+)
+_RESUME_PHRASE_RE = re.compile(
+    r'\b(?:years? of experience|proficient in|responsible for)\b'
+)
+
 SPACY_MODEL = "en_core_web_md"
 SPACY_FALLBACK = "en_core_web_sm"
 
+# Pipeline components detection never reads. NER supplies the entities and
+# validation scores PERSON candidates by token.tag_, so tok2vec, tagger and
+# ner stay; the dependency parser is the expensive one to skip.
+_SPACY_EXCLUDE = ["parser", "lemmatizer"]
+
+# Documents per nlp.pipe() batch (override with PII_BUDDY_SPACY_BATCH)
+SPACY_BATCH_SIZE = int(os.environ.get("PII_BUDDY_SPACY_BATCH", "32"))
 
-def _load_spacy():
+
+def _load_spacy(model: str = "", gpu: bool = False):
     import spacy
-    for model in (SPACY_MODEL, SPACY_FALLBACK):
+    global _on_gpu
+    _on_gpu = gpu and spacy.prefer_gpu()
+    if gpu and not _on_gpu:
+        logger.warning("No GPU available for spaCy — running on CPU.")
+    preferred = SPACY_MODELS[model] if model else SPACY_MODEL
+    for name in (preferred, SPACY_FALLBACK):
         try:
-            return spacy.load(model)
+            return spacy.load(name, exclude=_SPACY_EXCLUDE)
         except OSError:
             pass
     # Download fallback
     import spacy.cli
     print(f"Downloading spaCy model {SPACY_FALLBACK} (one-time)...")
     spacy.cli.download(SPACY_FALLBACK)
-    return spacy.load(SPACY_FALLBACK)
+    return spacy.load(SPACY_FALLBACK, exclude=_SPACY_EXCLUDE)
 
 
 _nlp = None
+_nlp_key = ("", False)  # (model, gpu) the loaded pipeline was built for
+_on_gpu = False  # whether the loaded pipeline runs on the GPU
+_nlp_lock = threading.Lock()
+
 
+def get_nlp(model: str = "", gpu: bool = False):
+    """Return the shared spaCy pipeline, loading it on first use.
 
-def get_nlp():
-    global _nlp
-    if _nlp is None:
-        _nlp = _load_spacy()
-    return _nlp
+    model is a SPACY_MODELS key ("" = en_core_web_md, falling back to sm).
+    The pipeline is reloaded when model or gpu changes, e.g. after
+    settings.conf is edited under the menu bar app or watch mode. A call
+    made while a prewarm is loading waits for it instead of loading a
+    second copy.
+    """
+    global _nlp, _nlp_key
+    key = (model, gpu)
+    with _nlp_lock:
+        if _nlp is None or key != _nlp_key:
+            _nlp = _load_spacy(model, gpu)
+            _nlp_key = key
+        return _nlp
+
+
+def prewarm_nlp_async(model: str = "", gpu: bool = False) -> None:
+    """Start loading the spaCy pipeline on a background thread.
+
+    Lets the multi-second model load overlap with reading input. GPU loads
+    are left to the first real call, since thinc selects the GPU per thread.
+    """
+    if gpu:
+        return
+
+    def load():
+        try:
+            get_nlp(model)
+        except Exception:
+            pass  # the first real get_nlp() call retries and reports it
+
+    threading.Thread(target=load, name="pii-buddy-nlp", daemon=True).start()
 
 
 def _is_specific_date(text: str) -> bool:
-    if not any(c.isdigit() for c in text):
+    if not _HAS_DIGIT_RE.search(text):
         return False
     if _VAGUE_DATE_RE.search(text):
         return False
@@ -130,21 +250,16 @@ def _is_specific_date(text: str) -> bool:
 
 def _basic_person_check(text: str) -> bool:
     """Quick pre-filter before full validation."""
-    if "@" in text or "\n" in text:
-        return False
-    if any(c.isdigit() for c in text):
+    if _NON_NAME_CHAR_RE.search(text):
         return False
-    parts = text.strip().split()
-    if not parts or len(parts) > 5:
-        return False
-    return True
+    return 1 <= len(text.split()) <= 5
 
 
 def _detect_allcaps_names(text: str) -> list[PIIEntity]:
     """Detect ALL CAPS names in resume headers."""
     entities = []
     header = text[:500]
-    for match in re.finditer(r"^([A-Z][A-Z]+(?:\s+[A-Z][A-Z]+){0,3})\s*$", header, re.MULTILINE):
+    for match in _ALLCAPS_HEADER_RE.finditer(header):
         name = match.group(1)
         words = name.split()
         if len(words) >= 2 and all(w.isalpha() for w in words):
@@ -167,8 +282,8 @@ def _detect_header_names(text: str) -> list[PIIEntity]:
             continue
         name_part = stripped.split(' - ', 1)[0].strip()
         # Remove trailing link/emoji artifacts
-        name_part = re.sub(r'\s*[\(\[].+$', '', name_part).strip()
-        candidates = re.split(r'\s+and\s+', name_part, flags=re.IGNORECASE)
+        name_part = _HEADER_TRAILER_RE.sub('', name_part).strip()
+        candidates = _HEADER_AND_RE.split(name_part)
         for name in candidates:
             name = name.strip()
             words = name.split()
@@ -203,22 +318,28 @@ def _clean_person_entities(entities: list[PIIEntity]) -> list[PIIEntity]:
 
 def _detect_doc_type(text: str) -> str:
     """Auto-detect document type: resume, transcript, or general."""
-    sample = text[:1500].lower()
+    # Only the opening matters, so re-processed files skip the searches
+    return _classify_opening(text[:1500])
+
+
+@lru_cache(maxsize=64)
+def _classify_opening(opening: str) -> str:
+    sample = opening.lower()
 
     transcript_score = 0
-    if re.search(r'\b(?:interviewer|interviewee|moderator|speaker\s*\d+)\s*:', sample):
+    if _INTERVIEWER_RE.search(sample):
         transcript_score += 3
-    if re.search(r'^\s*[A-Z][a-z]+\s*:', text[:1500], re.MULTILINE):
+    if _LEADING_NAME_RE.search(opening):
         transcript_score += 1
-    if re.search(r'\b(?:q:|a:|question:|answer:)', sample):
+    if _QA_RE.search(sample):
         transcript_score += 2
 
     resume_score = 0
-    if re.search(r'\b(?:resume|curriculum vitae|cv)\b', sample):
+    if _RESUME_KW_RE.search(sample):
         resume_score += 3
-    if re.search(r'\b(?:professional summary|work experience|education)\b', sample):
+    if _RESUME_SEC_RE.search(sample):
         resume_score += 2
-    if re.search(r'\b(?:years? of experience|proficient in|responsible for)\b', sample):
+    if _RESUME_PHRASE_RE.search(sample):
         resume_score += 1
 
     if transcript_score > resume_score and transcript_score >= 3:
@@ -228,43 +349,111 @@ def _detect_doc_type(text: str) -> str:
     return "general"
 
 
-def detect_pii(text: str, doc_type: str = "auto") -> list[PIIEntity]:
+def _spacy_processes(n_texts: int, jobs: int = 0) -> int:
+    """Worker processes for nlp.pipe() — never more than there are batches.
+
+    jobs caps the count; 0 means half the CPU cores.
+    """
+    if _on_gpu:
+        # Forked workers can't share the GPU; one process batches on it
+        return 1
+    n_batches = -(-n_texts // SPACY_BATCH_SIZE)
+    return max(1, min(jobs or (os.cpu_count() or 1) // 2, n_batches))
+
+
+def detect_pii(
+    text: str,
+    doc_type: str = "auto",
+    model: str = "",
+    gpu: bool = False,
+    regex_only: bool = False,
+) -> list[PIIEntity]:
     """
     Detect PII in text using regex + spaCy NER + validation.
 
     Two-pass approach:
       1. Detect all candidate entities (permissive)
       2. Validate and score confidence (selective)
+
+    regex_only skips spaCy entirely: only structured PII (emails, phones,
+    SSNs, ...) is found, not names.
     """
+    return detect_pii_batch([text], doc_type, model, gpu, regex_only)[0]
+
+
+def detect_pii_batch(
+    texts: list[str],
+    doc_type: str = "auto",
+    model: str = "",
+    gpu: bool = False,
+    regex_only: bool = False,
+    jobs: int = 0,
+) -> list[list[PIIEntity]]:
+    """Detect PII in several texts, running spaCy over them in one nlp.pipe() call.
+
+    jobs caps the worker processes nlp.pipe() fans batches out to (0 = half
+    the CPU cores). Returns one entity list per input text, in the same order.
+    """
+    texts = list(texts)
+    results = [None] * len(texts)
+
+    # Texts without a single capital letter can't hold the names spaCy is
+    # here for — give them the regex pass only.
+    ner_indices = []
+    for i, text in enumerate(texts):
+        if regex_only or not _may_contain_names(text):
+            results[i] = _dedupe(_detect_regex(text))
+        else:
+            ner_indices.append(i)
+
+    if ner_indices:
+        nlp = get_nlp(model, gpu)
+        docs = nlp.pipe(
+            (texts[i] for i in ner_indices),
+            batch_size=SPACY_BATCH_SIZE,
+            n_process=_spacy_processes(len(ner_indices), jobs),
+        )
+        for i, doc in zip(ner_indices, docs):
+            results[i] = _detect_in_doc(texts[i], doc, doc_type)
+    return results
+
+
+# Two letters in a row (any script) — the least a name or month can be
+_LETTER_PAIR_RE = re.compile(r"[^\W\d_]{2}")
+
+
+def _may_contain_names(text: str) -> bool:
+    """Whether spaCy could find anything: needs a capital and a word."""
+    return text != text.lower() and _LETTER_PAIR_RE.search(text) is not None
+
+
+def _detect_in_doc(text: str, doc, doc_type: str) -> list[PIIEntity]:
+    """Run the detection + validation passes for one text and its spaCy Doc."""
     if doc_type == "auto":
         doc_type = _detect_doc_type(text)
 
     # --- Pass 1: Detection ---
 
     # 1a. Regex (structured PII — high confidence)
-    regex_entities = []
-    for pattern, label in REGEX_PATTERNS:
-        for match in pattern.finditer(text):
-            regex_entities.append(PIIEntity(
-                text=match.group(),
-                label=label,
-                start=match.start(),
-                end=match.end(),
-                confidence=1.0,
-            ))
+    regex_entities = _detect_regex(text)
 
-    regex_ranges = set()
-    for ent in regex_entities:
-        regex_ranges.update(range(ent.start, ent.end))
+    # Regex spans merged into sorted, disjoint intervals
+    regex_starts, regex_ends = [], []
+    for ent in sorted(regex_entities, key=lambda e: e.start):
+        if regex_ends and ent.start < regex_ends[-1]:
+            regex_ends[-1] = max(regex_ends[-1], ent.end)
+        else:
+            regex_starts.append(ent.start)
+            regex_ends.append(ent.end)
 
     # 1b. spaCy NER (names and dates)
-    nlp = get_nlp()
-    doc = nlp(text)
     spacy_entities = []
 
     for ent in doc.ents:
-        ent_range = set(range(ent.start_char, ent.end_char))
-        if ent_range & regex_ranges:
+        # Skip entities overlapping a regex match: the last interval
+        # starting inside the entity is the only one that can reach it
+        i = bisect_right(regex_starts, ent.end_char - 1) - 1
+        if i >= 0 and regex_ends[i] > ent.start_char:
             continue
 
         if ent.label_ == "PERSON" and _basic_person_check(ent.text):
@@ -298,13 +487,27 @@ def detect_pii(text: str, doc_type: str = "auto") -> list[PIIEntity]:
     # --- Pass 2: Validation ---
     validated = validate_entities(all_candidates, text, doc, doc_type)
 
-    # --- Deduplicate overlapping entities ---
-    validated.sort(key=lambda e: (e.start, -e.confidence, -(e.end - e.start)))
+    return _dedupe(validated)
+
+
+def _detect_regex(text: str) -> list[PIIEntity]:
+    """Find structured PII (emails, phones, SSNs, ...) with the regex patterns."""
+    # Positional arguments: this runs once per match, and keyword
+    # arguments roughly double PIIEntity's construction cost
+    return [
+        PIIEntity(match.group(), label, *match.span())
+        for finditer, label in _REGEX_FINDERS
+        for match in finditer(text)
+    ]
+
+
+def _dedupe(entities: list[PIIEntity]) -> list[PIIEntity]:
+    """Drop overlapping entities, keeping the earliest, most confident, longest."""
+    entities.sort(key=lambda e: (e.start, -e.confidence, -(e.end - e.start)))
     deduped = []
     last_end = -1
-    for ent in validated:
+    for ent in entities:
         if ent.start >= last_end:
             deduped.append(ent)
             last_end = ent.end
-
     return deduped
@@ -1,35 +1,139 @@
 """Extract plain text from PDF, DOCX, and TXT files."""
 
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 from pathlib import Path
 
+# Text files at least this big are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD = 1024 * 1024
 
-def extract_text(filepath: Path) -> str:
+# Minimum pages per worker process when extracting a long PDF; shorter
+# PDFs aren't worth the process start-up
+PDF_PAGES_PER_WORKER = 25
+
+
+def extract_text(filepath: Path, parallel: bool = True) -> str:
+    """Extract a file's plain text.
+
+    Long PDFs are split across worker processes; pass parallel=False
+    when the caller is already extracting several files concurrently.
+    """
     suffix = filepath.suffix.lower()
-    if suffix == ".pdf":
-        return _extract_pdf(filepath)
-    elif suffix in (".docx", ".doc"):
-        return _extract_docx(filepath)
-    elif suffix == ".txt":
-        return filepath.read_text(encoding="utf-8", errors="replace")
-    else:
+    extractor = _EXTRACTORS.get(suffix)
+    if extractor is None:
         raise ValueError(f"Unsupported file type: {suffix}")
+    if extractor is _extract_pdf:
+        return _extract_pdf(filepath, parallel)
+    return extractor(filepath)
+
+
+def read_text_file(filepath: Path, errors: str = "strict") -> str:
+    """Read a UTF-8 text file like Path.read_text().
+
+    Large files are decoded straight from a memory map, which skips
+    holding a full bytes copy of the file alongside the decoded text.
+    """
+    if filepath.stat().st_size < MMAP_THRESHOLD:
+        return filepath.read_text(encoding="utf-8", errors=errors)
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return normalize_newlines(str(mm, "utf-8", errors))
 
 
-def _extract_pdf(filepath: Path) -> str:
+def normalize_newlines(text: str) -> str:
+    """Translate \r\n and \r to \n, as text-mode reads do."""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _pymupdf():
+    """Return the pymupdf module, or None if it isn't installed."""
+    try:
+        import pymupdf  # optional: MuPDF parses in C, far faster than pdfminer
+        return pymupdf
+    except ImportError:
+        return None
+
+
+def _open_pdf(filepath: Path):
+    """Open a PDF with pymupdf if it's installed, otherwise pdfplumber."""
+    pymupdf = _pymupdf()
+    if pymupdf is not None:
+        return pymupdf.open(filepath)
     import pdfplumber
 
+    return pdfplumber.open(filepath)
+
+
+def _extract_pdf(filepath: Path, parallel: bool = True) -> str:
+    with _open_pdf(filepath) as doc:
+        n_pages = _pdf_page_count(doc)
+        workers = min(os.cpu_count() or 1, n_pages // PDF_PAGES_PER_WORKER)
+        if workers < 2 or not parallel:
+            return "\n\n".join(_pdf_page_texts(doc, 0, n_pages))
+
+    # Pages parse independently, so each worker opens the file and takes
+    # a contiguous range (neither backend is safe to share across threads)
+    bounds = [n_pages * i // workers for i in range(workers + 1)]
+    # Spawn, not fork: the caller may have other threads running (e.g. the
+    # spaCy prewarm), and a forked child can inherit one of their locks held
+    spawn = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as pool:
+        ranges = pool.map(
+            _extract_pdf_pages, repeat(filepath), bounds[:-1], bounds[1:]
+        )
+        return "\n\n".join(chain.from_iterable(ranges))
+
+
+def _extract_pdf_pages(filepath: Path, start: int, stop: int) -> list[str]:
+    """Worker entry point: open filepath and return the text of pages [start, stop)."""
+    with _open_pdf(filepath) as doc:
+        return _pdf_page_texts(doc, start, stop)
+
+
+def _pdf_page_count(doc) -> int:
+    if _pymupdf() is not None:
+        return doc.page_count
+    return len(doc.pages)
+
+
+def _pdf_page_texts(doc, start: int, stop: int) -> list[str]:
+    """Return the text of an open PDF's pages [start, stop), skipping empty pages."""
     pages = []
-    with pdfplumber.open(filepath) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text()
+    if _pymupdf() is not None:
+        for page in doc.pages(start, stop):
+            text = page.get_text("text").rstrip()
             if text:
                 pages.append(text)
-    return "\n\n".join(pages)
+        return pages
+
+    for page in doc.pages[start:stop]:
+        text = page.extract_text()
+        if text:
+            pages.append(text)
+    return pages
 
 
 def _extract_docx(filepath: Path) -> str:
     from docx import Document
 
     doc = Document(str(filepath))
-    paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+    # Paragraph.text is rebuilt from the runs' XML on every access, so read it once
+    paragraphs = [t for p in doc.paragraphs if (t := p.text) and not t.isspace()]
     return "\n\n".join(paragraphs)
+
+
+def _extract_txt(filepath: Path) -> str:
+    return read_text_file(filepath, errors="replace")
+
+
+# Suffix (lowercased) -> extractor; keep in step with SUPPORTED_EXTENSIONS
+_EXTRACTORS = {
+    ".pdf": _extract_pdf,
+    ".docx": _extract_docx,
+    ".doc": _extract_docx,
+    ".txt": _extract_txt,
+}
@@ -10,12 +10,18 @@ entity counts, and user-provided comments.
 import hashlib
 import json
 import logging
+from collections import deque
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 from .config import FEEDBACK_DIR
 
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json works the same
+    orjson = None
+
 logger = logging.getLogger("pii_buddy")
 
 
@@ -48,9 +54,14 @@ def save_feedback(entry: FeedbackEntry) -> Path:
     FEEDBACK_DIR.mkdir(parents=True, exist_ok=True)
     log_path = FEEDBACK_DIR / "feedback.jsonl"
 
-    line = json.dumps(asdict(entry), ensure_ascii=False)
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(line + "\n")
+    if orjson is not None:
+        line = orjson.dumps(asdict(entry), option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        line = (json.dumps(asdict(entry), ensure_ascii=False) + "\n").encode("utf-8")
+    # One unbuffered append per entry, so concurrent writers (CLI and
+    # menubar) never interleave partial lines
+    with open(log_path, "ab", buffering=0) as f:
+        f.write(line)
 
     logger.info(f"Feedback saved to {log_path.name}")
     return log_path
@@ -101,15 +112,19 @@ def load_feedback(limit: int = 100) -> list[dict]:
     if not log_path.exists():
         return []
 
-    entries = []
-    for line in log_path.read_text(encoding="utf-8").strip().splitlines():
-        if line.strip():
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-
-    return entries[-limit:][::-1]
+    loads = orjson.loads if orjson is not None else json.loads
+    # Stream the log, keeping only the newest `limit` entries in memory
+    entries = deque(maxlen=limit)
+    with open(log_path, "rb") as f:
+        for line in f:
+            if line.strip():
+                try:
+                    entries.append(loads(line))
+                except ValueError:  # malformed line (JSON or UTF-8)
+                    continue
+
+    entries.reverse()
+    return list(entries)
 
 
 def feedback_summary() -> dict:
@@ -0,0 +1,50 @@
+"""Read and write mapping files (the tag -> original value JSON sidecars)."""
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json works the same
+    orjson = None
+
+
+_WRITE_BUFFER = 1 << 20
+
+
+def save_mapping(mapping: dict, path: Path) -> None:
+    """Write a mapping as indented UTF-8 JSON, readable only by the owner.
+
+    The file is written to a temporary sibling, synced, and renamed into
+    place, so a crash never leaves a truncated mapping behind — it's the
+    only way to reverse a redaction.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    # Mappings hold the original PII, so don't inherit a permissive umask
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        if orjson is not None:
+            f = open(fd, "wb")
+        else:
+            f = open(fd, "w", encoding="utf-8", buffering=_WRITE_BUFFER)
+        with f:
+            if orjson is not None:
+                f.write(orjson.dumps(mapping, option=orjson.OPT_INDENT_2))
+            else:
+                # Stream chunks to disk rather than building the whole string
+                json.dump(mapping, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def load_mapping(path: Path) -> dict:
+    """Read a mapping file written by save_mapping()."""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
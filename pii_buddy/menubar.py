@@ -12,10 +12,13 @@ Usage:
 
 import json
 import logging
+import os
+import plistlib
 import subprocess
 import sys
 import threading
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger("pii_buddy")
@@ -51,8 +54,12 @@ def _require_rumps():
 
 # --- Preferences persistence ---
 
+_saved_prefs = None  # what's on disk, to skip no-op saves
+
+
 def _load_prefs() -> dict:
     """Load menubar preferences from JSON file."""
+    global _saved_prefs
     defaults = {
         "show_in_menubar": True,
         "show_in_dock": False,
@@ -63,18 +70,25 @@ def _load_prefs() -> dict:
         if _PREFS_PATH.exists():
             stored = json.loads(_PREFS_PATH.read_text(encoding="utf-8"))
             defaults.update(stored)
+            _saved_prefs = dict(defaults)
     except Exception:
         pass
     return defaults
 
 
 def _save_prefs(prefs: dict):
-    """Save menubar preferences to JSON file."""
+    """Save menubar preferences to JSON file (skipped if nothing changed)."""
+    global _saved_prefs
+    if prefs == _saved_prefs:
+        return
     try:
         _PREFS_DIR.mkdir(parents=True, exist_ok=True)
-        _PREFS_PATH.write_text(
-            json.dumps(prefs, indent=2), encoding="utf-8"
-        )
+        # Write a sibling and rename it over, so a crash mid-write can't
+        # leave a truncated file that resets every preference
+        tmp_path = _PREFS_PATH.with_name(_PREFS_PATH.name + ".tmp")
+        tmp_path.write_text(json.dumps(prefs, indent=2), encoding="utf-8")
+        os.replace(tmp_path, _PREFS_PATH)
+        _saved_prefs = dict(prefs)
     except Exception as e:
         logger.warning(f"Could not save preferences: {e}")
 
@@ -84,37 +98,18 @@ def _save_prefs(prefs: dict):
 def _set_login_item(enabled: bool):
     """Create or remove a LaunchAgent plist for auto-start at login."""
     if enabled:
-        python_path = sys.executable
-        project_dir = str(Path(__file__).parent.parent)
-        plist = f"""\
-<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN"
-  "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>{_LAUNCHAGENT_LABEL}</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>{python_path}</string>
-        <string>-m</string>
-        <string>pii_buddy.menubar</string>
-    </array>
-    <key>WorkingDirectory</key>
-    <string>{project_dir}</string>
-    <key>RunAtLoad</key>
-    <true/>
-    <key>KeepAlive</key>
-    <false/>
-    <key>StandardOutPath</key>
-    <string>/tmp/pii_buddy_menubar.log</string>
-    <key>StandardErrorPath</key>
-    <string>/tmp/pii_buddy_menubar.log</string>
-</dict>
-</plist>
-"""
+        # plistlib escapes paths containing & or < that an XML template wouldn't
+        plist = {
+            "Label": _LAUNCHAGENT_LABEL,
+            "ProgramArguments": [sys.executable, "-m", "pii_buddy.menubar"],
+            "WorkingDirectory": str(Path(__file__).parent.parent),
+            "RunAtLoad": True,
+            "KeepAlive": False,
+            "StandardOutPath": "/tmp/pii_buddy_menubar.log",
+            "StandardErrorPath": "/tmp/pii_buddy_menubar.log",
+        }
         _LAUNCHAGENT_DIR.mkdir(parents=True, exist_ok=True)
-        _LAUNCHAGENT_PATH.write_text(plist, encoding="utf-8")
+        _LAUNCHAGENT_PATH.write_bytes(plistlib.dumps(plist))
         logger.info(f"Login item created: {_LAUNCHAGENT_PATH}")
     else:
         if _LAUNCHAGENT_PATH.exists():
@@ -127,18 +122,25 @@ def _set_login_item(enabled: bool):
             logger.info("Login item removed.")
 
 
+@lru_cache(maxsize=1)
+def _ready_image():
+    """The Arbie NSImage, decoded once (raises ImportError without PyObjC)."""
+    from AppKit import NSImage
+    return NSImage.alloc().initWithContentsOfFile_(_ICON_READY)
+
+
 # --- Dock visibility ---
 
 def _set_dock_visible(visible: bool):
     """Toggle Dock icon visibility via PyObjC."""
     try:
-        from AppKit import NSApplication, NSImage
+        from AppKit import NSApplication
         # 0 = NSApplicationActivationPolicyRegular (show in Dock)
         # 1 = NSApplicationActivationPolicyAccessory (hide from Dock)
         policy = 0 if visible else 1
         NSApplication.sharedApplication().setActivationPolicy_(policy)
         if visible:
-            icon = NSImage.alloc().initWithContentsOfFile_(_ICON_READY)
+            icon = _ready_image()
             if icon:
                 NSApplication.sharedApplication().setApplicationIconImage_(icon)
     except ImportError:
@@ -152,6 +154,7 @@ class PIIBuddyMenuBar:
         rumps = _require_rumps()
         self._rumps = rumps
         self._last_mapping_path: Path | None = None
+        self._last_mapping: dict | None = None  # contents of _last_mapping_path
         self._processing = False
         self._done_timer = None
         self._last_entities_found = 0
@@ -214,8 +217,8 @@ class PIIBuddyMenuBar:
 
         # Always set Arbie as the app icon (used by alerts and Dock)
         try:
-            from AppKit import NSApplication, NSImage
-            icon = NSImage.alloc().initWithContentsOfFile_(_ICON_READY)
+            from AppKit import NSApplication
+            icon = _ready_image()
             if icon:
                 NSApplication.sharedApplication().setApplicationIconImage_(icon)
         except ImportError:
@@ -224,8 +227,10 @@ class PIIBuddyMenuBar:
         # Pre-load spaCy in background so first click is fast
         threading.Thread(target=self._preload, daemon=True).start()
 
-        # Set up Dock right-click menu after a short delay
-        threading.Thread(target=self._setup_dock_menu, daemon=True).start()
+        # Set up Dock right-click menu once the run loop is going (on the
+        # main thread, where AppKit objects may be touched)
+        self._dock_menu_timer = rumps.Timer(self._setup_dock_menu, 1)
+        self._dock_menu_timer.start()
 
         # Prompt to start at login on first launch (fires once after 2s)
         if not self._prefs.get("prompted_login"):
@@ -235,9 +240,19 @@ class PIIBuddyMenuBar:
             self._login_prompt_timer.start()
 
     def _preload(self):
+        """Warm up everything the first click needs, off the main thread."""
         try:
+            from . import clipboard, mapping, redactor, restorer  # noqa: F401
+            from .config import BASE_DIR
             from .detector import get_nlp
-            get_nlp()
+            from .settings import resolve_settings
+            settings = resolve_settings(base_dir=BASE_DIR)
+            # thinc picks the GPU per thread, so a GPU pipeline is left
+            # for the first click to load on the thread that uses it
+            if not settings.regex_only and not settings.gpu:
+                get_nlp(settings.spacy_model)
+            if settings.verify_enabled:
+                from . import verifier  # noqa: F401  (premium; may be absent)
         except Exception:
             pass
 
@@ -246,7 +261,7 @@ class PIIBuddyMenuBar:
         _timer.stop()
         # Build NSAlert directly so we can set the Arbie icon on it
         try:
-            from AppKit import NSAlert, NSImage, NSAlertFirstButtonReturn
+            from AppKit import NSAlert, NSAlertFirstButtonReturn
             alert = NSAlert.alloc().init()
             alert.setMessageText_("Start at Login?")
             alert.setInformativeText_(
@@ -255,7 +270,7 @@ class PIIBuddyMenuBar:
             )
             alert.addButtonWithTitle_("Yes")
             alert.addButtonWithTitle_("No")
-            icon = NSImage.alloc().initWithContentsOfFile_(_ICON_READY)
+            icon = _ready_image()
             if icon:
                 alert.setIcon_(icon)
             response = alert.runModal()
@@ -281,11 +296,9 @@ class PIIBuddyMenuBar:
 
     # --- Dock right-click menu (PyObjC) ---
 
-    def _setup_dock_menu(self):
+    def _setup_dock_menu(self, _timer):
         """Add a right-click menu to the Dock icon via PyObjC."""
-        import time
-        time.sleep(1)  # wait for rumps to finish NSApp setup
-
+        _timer.stop()
         try:
             from AppKit import NSApplication, NSMenu, NSMenuItem
             from Foundation import NSObject
@@ -446,21 +459,29 @@ class PIIBuddyMenuBar:
 
     def _do_remove_pii(self, sender):
         try:
-            text = self._read_clipboard()
-            if not text:
+            from .clipboard import read_clipboard, write_clipboard
+
+            text = read_clipboard()
+            if not text.strip():
                 self._notify("Clipboard is empty.")
                 self._set_icon(_ICON_READY)
                 return
 
             from .config import BASE_DIR, MAPPINGS_DIR
             from .detector import detect_pii
+            from .mapping import save_mapping
             from .redactor import redact
             from .settings import resolve_settings, seed_settings_file
 
             seed_settings_file(BASE_DIR)
             settings = resolve_settings(base_dir=BASE_DIR)
 
-            entities = detect_pii(text)
+            entities = detect_pii(
+                text,
+                model=settings.spacy_model,
+                gpu=settings.gpu,
+                regex_only=settings.regex_only,
+            )
             if not entities:
                 self._notify("No PII detected in clipboard text.")
                 self._set_icon(_ICON_READY)
@@ -478,22 +499,21 @@ class PIIBuddyMenuBar:
                 except Exception as e:
                     logger.warning(f"Verify skipped: {e}")
 
-            self._write_clipboard(redacted_text)
+            write_clipboard(redacted_text)
 
             # Save mapping
             MAPPINGS_DIR.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             mapping["metadata"] = {
                 "source": "menubar",
-                "processed_at": datetime.now().isoformat(),
+                "processed_at": now.isoformat(),
                 "entities_found": len(entities),
             }
             mapping_path = MAPPINGS_DIR / f"clipboard_{timestamp}.map.json"
-            mapping_path.write_text(
-                json.dumps(mapping, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            save_mapping(mapping, mapping_path)
             self._last_mapping_path = mapping_path
+            self._last_mapping = mapping
             self._last_entities_found = len(entities)
 
             self._notify(
@@ -512,15 +532,17 @@ class PIIBuddyMenuBar:
 
     def _do_restore(self):
         try:
-            text = self._read_clipboard()
-            if not text:
+            from .clipboard import read_clipboard, write_clipboard
+
+            text = read_clipboard()
+            if not text.strip():
                 self._notify("Clipboard is empty.")
                 self._set_icon(_ICON_READY)
                 return
 
             from .restorer import restore
-            restored = restore(text, self._last_mapping_path)
-            self._write_clipboard(restored)
+            restored = restore(text, self._last_mapping_path, self._last_mapping)
+            write_clipboard(restored)
             self._notify("PII Restored! Original text copied to clipboard.")
             self._show_done_then_reset()
         except Exception as e:
@@ -531,17 +553,6 @@ class PIIBuddyMenuBar:
 
     # --- Helpers ---
 
-    @staticmethod
-    def _read_clipboard() -> str:
-        result = subprocess.run(
-            ["pbpaste"], capture_output=True, text=True
-        )
-        return result.stdout.strip()
-
-    @staticmethod
-    def _write_clipboard(text: str):
-        subprocess.run(["pbcopy"], input=text, text=True)
-
     def _notify(self, message: str):
         self._rumps.notification("PII Buddy", "", message)
 
@@ -3,6 +3,13 @@
 import re
 from collections import defaultdict
 
+from .detector import _compile
+
+
+def _has_dotted_or_dotless_i(s: str) -> bool:
+    # re.IGNORECASE matches "İ"/"ı" to "i"; RE2's Unicode case folding doesn't
+    return "\u0130" in s or "\u0131" in s
+
 
 def _make_initials(name: str) -> str:
     """Turn 'Steve Johnson' into 'SJ', 'Mary' into 'M'."""
@@ -10,6 +17,33 @@ def _make_initials(name: str) -> str:
     return "".join(p[0].upper() for p in parts if p)
 
 
+def _replace_all(text: str, replacements: list[tuple[str, str]], flags: int = 0) -> str:
+    """Replace each (needle, tag) pair's occurrences in one left-to-right pass.
+
+    Matches are taken leftmost first. Among needles starting at the same
+    offset the longest wins ("Steve Johnson" over "Steve"), and among equal
+    lengths the earliest pair in the list. A needle starting earlier wins
+    over a longer one starting later: in "Ann Lee Smith", "Ann Lee" is
+    replaced and "Lee Smith" is not. That differs from replacing needles
+    one at a time, longest first, which would have taken "Lee Smith".
+    """
+    if not replacements:
+        return text
+    ordered = sorted(replacements, key=lambda r: len(r[0]), reverse=True)
+    needles = [needle for needle, _ in ordered]
+    # One capture group per needle, so the match maps straight back to its tag
+    alternation = "|".join(f"({re.escape(needle)})" for needle in needles)
+    if flags & re.IGNORECASE and not any(
+        _has_dotted_or_dotless_i(s) for s in (text, *needles)
+    ):
+        # re tries a case-insensitive alternation needle by needle at every
+        # offset, which crawls on long texts; RE2 (when installed) doesn't
+        pattern = _compile(alternation, flags)
+    else:
+        pattern = re.compile(alternation, flags)
+    return pattern.sub(lambda m: ordered[m.lastindex - 1][1], text)
+
+
 def _group_names(person_entities: list) -> dict[str, str]:
     """
     Group name variants that refer to the same person.
@@ -23,19 +57,16 @@ def _group_names(person_entities: list) -> dict[str, str]:
     names = sorted(set(e.text for e in person_entities), key=len, reverse=True)
 
     canonical = {}  # surface_form -> full_name
+    part_owner = {}  # lowercased word -> first full name containing it
     for name in names:
-        if name in canonical:
-            continue
         # Check if this name is a component of an already-seen longer name
-        matched = False
-        for full in canonical.values():
-            full_parts = full.lower().split()
-            if name.lower() in full_parts:
-                canonical[name] = full
-                matched = True
-                break
-        if not matched:
+        full = part_owner.get(name.lower())
+        if full is not None:
+            canonical[name] = full
+        else:
             canonical[name] = name
+            for part in name.lower().split():
+                part_owner.setdefault(part, name)
 
     # Add individual parts of multi-word names as surface forms
     for name in list(canonical):
@@ -95,25 +126,26 @@ def redact(text: str, entities: list) -> tuple[str, dict]:
         tag = f"<<{ent.label}_{n}>>"
         value_to_tag[ent.text] = tag
 
-    # --- Perform replacements (work from end to start to preserve positions) ---
-    all_entities = sorted(entities, key=lambda e: e.start, reverse=True)
-    redacted = text
-
-    for ent in all_entities:
+    # --- Perform replacements (left to right, building the text once) ---
+    pieces = []
+    pos = 0
+    for ent in sorted(entities, key=lambda e: e.start):
+        if ent.start < pos:
+            continue  # overlaps the previous entity
         if ent.label == "PERSON":
             tag = surface_to_tag.get(ent.text, f"<NAME {_make_initials(ent.text)}>")
         else:
             tag = value_to_tag.get(ent.text, f"<<{ent.label}>>")
-        redacted = redacted[:ent.start] + tag + redacted[ent.end:]
+        pieces.append(text[pos:ent.start])
+        pieces.append(tag)
+        pos = ent.end
+    pieces.append(text[pos:])
+    redacted = "".join(pieces)
 
     # --- Also catch person name references that spaCy missed ---
-    # Sort by length descending so "Steve Johnson" is replaced before "Steve"
-    for surface in sorted(surface_to_tag, key=len, reverse=True):
-        tag = surface_to_tag[surface]
-        # Replace remaining occurrences that weren't entity-tagged
-        # Use word boundaries to avoid partial matches
-        pattern = re.compile(re.escape(surface), re.IGNORECASE)
-        redacted = pattern.sub(tag, redacted)
+    # Replace remaining occurrences that weren't entity-tagged, all surfaces
+    # in one pass ("Steve Johnson" wins over "Steve")
+    redacted = _replace_all(redacted, list(surface_to_tag.items()), re.IGNORECASE)
 
     # --- Build the reversible mapping ---
     tag_to_original = {}
@@ -1,23 +1,77 @@
 """Restore PII from a redacted file using its mapping."""
 
-import json
 import re
 from pathlib import Path
 
+from .mapping import load_mapping
 
-def restore(redacted_text: str, mapping_path: Path) -> str:
+# Characters of redacted text held in memory at once by restore_file()
+RESTORE_CHUNK_CHARS = 16 << 20
+_WRITE_BUFFER = 1 << 20
+
+
+def _tag_pattern(tags: dict) -> re.Pattern:
+    # Longest tags first to avoid partial matches
+    return re.compile("|".join(re.escape(tag) for tag in sorted(tags, key=len, reverse=True)))
+
+
+def restore(redacted_text: str, mapping_path: Path, mapping: dict = None) -> str:
     """
     Reverse the redaction using the mapping file.
 
     Replaces tags like <<SJ>>, <<EMAIL_1>> back with original values.
+    Pass mapping if the caller has already loaded mapping_path.
+    """
+    if mapping is None:
+        mapping = load_mapping(mapping_path)
+    tags = mapping.get("tags", {})
+    if not tags:
+        return redacted_text
+
+    # One pass over the text for all tags
+    return _tag_pattern(tags).sub(lambda m: tags[m.group()], redacted_text)
+
+
+def restore_file(redacted_path: Path, out_path: Path, mapping_path: Path, mapping: dict = None) -> None:
+    """Like restore(), but streams redacted_path to out_path a chunk at a time.
+
+    Memory use is bounded by RESTORE_CHUNK_CHARS however large the file is.
     """
-    mapping = json.loads(mapping_path.read_text(encoding="utf-8"))
+    if mapping is None:
+        mapping = load_mapping(mapping_path)
     tags = mapping.get("tags", {})
+    pattern = _tag_pattern(tags) if tags else None
+    # Any tag starting this far from the end of the buffer fits inside it,
+    # so only the tail after that point has to wait for the next chunk
+    overlap = max(map(len, tags), default=1) - 1
 
-    restored = redacted_text
+    with open(redacted_path, encoding="utf-8") as src:
+        try:
+            with open(out_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as dst:
+                buf = ""
+                while True:
+                    chunk = src.read(RESTORE_CHUNK_CHARS)
+                    buf += chunk
+                    cut = len(buf) - overlap if chunk else len(buf)
 
-    # Replace longest tags first to avoid partial matches
-    for tag in sorted(tags, key=len, reverse=True):
-        restored = restored.replace(tag, tags[tag])
+                    pieces = []
+                    pos = 0
+                    if pattern is not None:
+                        for m in pattern.finditer(buf):
+                            if m.start() >= cut:
+                                break
+                            pieces.append(buf[pos:m.start()])
+                            pieces.append(tags[m.group()])
+                            pos = m.end()
+                    if pos < cut:
+                        pieces.append(buf[pos:cut])
+                        pos = cut
+                    dst.write("".join(pieces))
+                    buf = buf[pos:]
 
-    return restored
+                    if not chunk:
+                        break
+        except BaseException:
+            # Don't leave a half-restored file behind (e.g. on bad UTF-8)
+            out_path.unlink(missing_ok=True)
+            raise
@@ -5,7 +5,7 @@ import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from .config import SETTINGS_FILENAME
+from .config import SETTINGS_FILENAME, SPACY_MODELS
 
 logger = logging.getLogger("pii_buddy")
 
@@ -34,6 +34,16 @@ SETTINGS_TEMPLATE = """\
 [audit]
 # enabled = true
 
+[detection]
+# model = md            # spaCy model: sm (fastest), md, lg, trf (most accurate)
+# gpu = false
+# regex_only = false    # skip spaCy: structured PII only, no names
+# jobs = 0              # spaCy worker processes; 0 = half the CPU cores
+
+[watch]
+# poll = false          # poll the input folder instead of OS file events
+# interval = 1.0        # seconds between polls
+
 [openrouter]
 # enabled = false
 # api_key =
@@ -63,6 +73,12 @@ class Settings:
     openrouter_api_key: str = ""
     openrouter_model: str = "meta-llama/llama-3.1-8b-instruct:free"
     openrouter_endpoint: str = "https://openrouter.ai/api/v1"
+    spacy_model: str = ""             # SPACY_MODELS key; "" = md with sm fallback
+    gpu: bool = False                 # run spaCy on GPU if one is available
+    regex_only: bool = False          # skip spaCy; structured PII only, no names
+    jobs: int = 0                     # spaCy worker processes; 0 = half the CPU cores
+    watch_poll: bool = False          # poll input dir (network drives) instead of OS events
+    watch_interval: float = 1.0       # seconds between polls when watch_poll is on
 
     @classmethod
     def defaults(cls) -> "Settings":
@@ -70,12 +86,28 @@ class Settings:
         return cls()
 
 
+_config_cache = {}
+
+
 def load_config_file(base_dir: Path) -> dict:
     """Load settings.conf from base_dir. Returns a flat dict of found values."""
     config_path = base_dir / SETTINGS_FILENAME
-    if not config_path.exists():
+    try:
+        mtime = config_path.stat().st_mtime_ns
+    except OSError:
         return {}
 
+    # The menu bar app resolves settings on every click, so only reparse
+    # when the file has been edited
+    key = str(config_path)
+    cached = _config_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, _parse_config_file(config_path))
+        _config_cache[key] = cached
+    return dict(cached[1])
+
+
+def _parse_config_file(config_path: Path) -> dict:
     parser = configparser.ConfigParser()
     parser.read(str(config_path), encoding="utf-8")
 
@@ -121,6 +153,22 @@ def load_config_file(base_dir: Path) -> dict:
     if parser.has_option("openrouter", "endpoint"):
         values["openrouter_endpoint"] = parser.get("openrouter", "endpoint").strip()
 
+    # [detection] section
+    if parser.has_option("detection", "model"):
+        values["spacy_model"] = parser.get("detection", "model").strip()
+    if parser.has_option("detection", "gpu"):
+        values["gpu"] = parser.getboolean("detection", "gpu")
+    if parser.has_option("detection", "regex_only"):
+        values["regex_only"] = parser.getboolean("detection", "regex_only")
+    if parser.has_option("detection", "jobs"):
+        values["jobs"] = parser.getint("detection", "jobs")
+
+    # [watch] section
+    if parser.has_option("watch", "poll"):
+        values["watch_poll"] = parser.getboolean("watch", "poll")
+    if parser.has_option("watch", "interval"):
+        values["watch_interval"] = parser.getfloat("watch", "interval")
+
     return values
 
 
@@ -139,6 +187,12 @@ def resolve_settings(
     cli_openrouter: bool = False,
     cli_openrouter_key: str = None,
     cli_openrouter_model: str = None,
+    cli_model: str = None,
+    cli_gpu: bool = False,
+    cli_regex_only: bool = False,
+    cli_jobs: int = None,
+    cli_watch_poll: bool = False,
+    cli_watch_interval: float = None,
 ) -> Settings:
     """
     Three-tier merge: CLI flags > settings.conf > hardcoded defaults.
@@ -149,134 +203,72 @@ def resolve_settings(
     defaults = Settings.defaults()
     conf = load_config_file(base_dir)
 
-    # --- output_format ---
-    output_format = defaults.output_format
-    if "output_format" in conf:
-        output_format = conf["output_format"]
-    if cli_same_format:
-        output_format = "same"
-
-    # --- tag ---
-    tag = defaults.tag
-    if "tag" in conf:
-        tag = conf["tag"]
-    if cli_tag is not None:
-        tag = cli_tag
-
-    # --- keep_name ---
-    keep_name = cli_keep_name
-
-    # --- overwrite ---
-    overwrite = defaults.overwrite
-    if "overwrite" in conf:
-        overwrite = conf["overwrite"]
-    if cli_overwrite:
-        overwrite = True
+    # CLI value for each setting; None means "not given on the command
+    # line". Boolean flags can only switch a setting one way, so an unset
+    # flag is None too rather than overriding settings.conf.
+    cli_values = {
+        "output_format": "same" if cli_same_format else None,
+        "tag": cli_tag,
+        "keep_name": cli_keep_name or None,
+        "overwrite": cli_overwrite or None,
+        "text_output": cli_text_output or None,
+        "verify_enabled": cli_verify or None,
+        "verify_api_key": cli_verify_key,
+        "verify_endpoint": cli_verify_endpoint,
+        "verify_confidence": cli_verify_confidence,
+        "verify_canaries": None,
+        "audit_enabled": False if cli_no_audit else None,
+        "openrouter_enabled": cli_openrouter or None,
+        "openrouter_api_key": cli_openrouter_key,
+        "openrouter_model": cli_openrouter_model,
+        "openrouter_endpoint": None,
+        "spacy_model": cli_model,
+        "gpu": cli_gpu or None,
+        "regex_only": cli_regex_only or None,
+        "jobs": cli_jobs,
+        "watch_poll": cli_watch_poll or None,
+        "watch_interval": cli_watch_interval,
+    }
+    values = {
+        name: cli_value if cli_value is not None else conf.get(name, getattr(defaults, name))
+        for name, cli_value in cli_values.items()
+    }
+
     # --overwrite implies --same-format
-    if overwrite:
-        output_format = "same"
-
-    # --- text_output ---
-    text_output = defaults.text_output
-    if "text_output" in conf:
-        text_output = conf["text_output"]
-    if cli_text_output:
-        text_output = True
-
-    # --- paths ---
-    input_rel = conf.get("input_dir", "input")
-    output_rel = conf.get("output_dir", "output")
-    input_dir = base_dir / input_rel
-    output_dir = base_dir / output_rel
-
-    # --- verify ---
-    verify_enabled = defaults.verify_enabled
-    if "verify_enabled" in conf:
-        verify_enabled = conf["verify_enabled"]
-    if cli_verify:
-        verify_enabled = True
-
-    verify_api_key = defaults.verify_api_key
-    if "verify_api_key" in conf:
-        verify_api_key = conf["verify_api_key"]
-    if cli_verify_key is not None:
-        verify_api_key = cli_verify_key
-
-    verify_endpoint = defaults.verify_endpoint
-    if "verify_endpoint" in conf:
-        verify_endpoint = conf["verify_endpoint"]
-    if cli_verify_endpoint is not None:
-        verify_endpoint = cli_verify_endpoint
-
-    verify_confidence = defaults.verify_confidence
-    if "verify_confidence" in conf:
-        verify_confidence = conf["verify_confidence"]
-    if cli_verify_confidence is not None:
-        verify_confidence = cli_verify_confidence
-
-    verify_canaries = defaults.verify_canaries
-    if "verify_canaries" in conf:
-        verify_canaries = conf["verify_canaries"]
+    if values["overwrite"]:
+        values["output_format"] = "same"
 
     # --verify requires an API key
-    if verify_enabled and not verify_api_key:
+    if values["verify_enabled"] and not values["verify_api_key"]:
         logger.warning("--verify requires an API key (--verify-key or settings.conf)")
-        verify_enabled = False
-
-    # --- audit ---
-    audit_enabled = defaults.audit_enabled
-    if "audit_enabled" in conf:
-        audit_enabled = conf["audit_enabled"]
-    if cli_no_audit:
-        audit_enabled = False
-
-    # --- openrouter ---
-    openrouter_enabled = defaults.openrouter_enabled
-    if "openrouter_enabled" in conf:
-        openrouter_enabled = conf["openrouter_enabled"]
-    if cli_openrouter:
-        openrouter_enabled = True
-
-    openrouter_api_key = defaults.openrouter_api_key
-    if "openrouter_api_key" in conf:
-        openrouter_api_key = conf["openrouter_api_key"]
-    if cli_openrouter_key is not None:
-        openrouter_api_key = cli_openrouter_key
-
-    openrouter_model = defaults.openrouter_model
-    if "openrouter_model" in conf:
-        openrouter_model = conf["openrouter_model"]
-    if cli_openrouter_model is not None:
-        openrouter_model = cli_openrouter_model
-
-    openrouter_endpoint = defaults.openrouter_endpoint
-    if "openrouter_endpoint" in conf:
-        openrouter_endpoint = conf["openrouter_endpoint"]
+        values["verify_enabled"] = False
 
     # --openrouter requires an API key
-    if openrouter_enabled and not openrouter_api_key:
+    if values["openrouter_enabled"] and not values["openrouter_api_key"]:
         logger.warning("--openrouter requires an API key (--openrouter-key or settings.conf)")
-        openrouter_enabled = False
+        values["openrouter_enabled"] = False
+
+    spacy_model = values["spacy_model"]
+    if spacy_model and spacy_model not in SPACY_MODELS:
+        logger.warning(f"Unknown spaCy model {spacy_model!r} — using the default")
+        values["spacy_model"] = defaults.spacy_model
+
+    if values["jobs"] < 0:
+        logger.warning("Jobs can't be negative — using half the CPU cores")
+        values["jobs"] = defaults.jobs
+
+    # --watch-interval implies --watch-poll
+    if cli_watch_interval is not None:
+        values["watch_poll"] = True
+    if values["watch_interval"] <= 0:
+        logger.warning(f"Watch interval must be positive — using {defaults.watch_interval}s")
+        values["watch_interval"] = defaults.watch_interval
 
     return Settings(
         base_dir=base_dir,
-        input_dir=input_dir,
-        output_dir=output_dir,
-        output_format=output_format,
-        tag=tag,
-        keep_name=keep_name,
-        overwrite=overwrite,
-        text_output=text_output,
-        verify_enabled=verify_enabled,
-        verify_api_key=verify_api_key,
-        verify_endpoint=verify_endpoint,
-        verify_confidence=verify_confidence,
-        verify_canaries=verify_canaries,
-        audit_enabled=audit_enabled,
-        openrouter_enabled=openrouter_enabled,
-        openrouter_api_key=openrouter_api_key,
-        openrouter_model=openrouter_model,
-        openrouter_endpoint=openrouter_endpoint,
+        input_dir=base_dir / conf.get("input_dir", "input"),
+        output_dir=base_dir / conf.get("output_dir", "output"),
+        **values,
     )
 
 
@@ -36,6 +36,11 @@ CERTIFICATION_PATTERNS = [
     re.compile(r'\bSix\s+Sigma\b', re.IGNORECASE),
 ]
 
+# One C-level scan instead of a Python loop over str.isdigit()
+_HAS_DIGIT_RE = re.compile(r"\d")
+# Characters that never appear in a person's name
+_NON_NAME_CHAR_RE = re.compile(r"[@\n\d]")
+
 SECTION_HEADERS = {
     'professional summary', 'executive summary', 'career summary',
     'career objective', 'objective', 'profile', 'summary',
@@ -62,6 +67,8 @@ class ValidationContext:
     text: str
     spacy_doc: object
     non_person_labels: set = field(default_factory=set)
+    # Fetched once per document: each fetch stats every blocklist file
+    blocklist: set = field(default_factory=lambda: _get_blocklist())
 
 
 def _load_blocklist(filepath: Path) -> set[str]:
@@ -76,18 +83,38 @@ def _load_blocklist(filepath: Path) -> set[str]:
     return entries
 
 
+_BLOCKLIST_FILES = (
+    # Package blocklists (official + custom template)
+    BLOCKLISTS_DIR / "person_blocklist.txt",
+    BLOCKLISTS_DIR / "custom_blocklist.txt",
+    # User's local blocklist (never overwritten by --update)
+    USER_BLOCKLISTS_DIR / "user_blocklist.txt",
+)
+
 _blocklist_cache = None
+_blocklist_stamp = None
+
+
+def _blocklist_mtimes() -> tuple:
+    """Modification times of the blocklist files (None for missing ones)."""
+    stamp = []
+    for path in _BLOCKLIST_FILES:
+        try:
+            stamp.append(path.stat().st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
 
 
 def _get_blocklist() -> set[str]:
-    global _blocklist_cache
-    if _blocklist_cache is None:
+    global _blocklist_cache, _blocklist_stamp
+    # Reload when a file is edited, e.g. user_blocklist.txt during --watch
+    stamp = _blocklist_mtimes()
+    if _blocklist_cache is None or stamp != _blocklist_stamp:
         _blocklist_cache = set()
-        # Package blocklists (official + custom template)
-        for name in ("person_blocklist.txt", "custom_blocklist.txt"):
-            _blocklist_cache |= _load_blocklist(BLOCKLISTS_DIR / name)
-        # User's local blocklist (never overwritten by --update)
-        _blocklist_cache |= _load_blocklist(USER_BLOCKLISTS_DIR / "user_blocklist.txt")
+        for path in _BLOCKLIST_FILES:
+            _blocklist_cache |= _load_blocklist(path)
+        _blocklist_stamp = stamp
     return _blocklist_cache
 
 
@@ -139,7 +166,7 @@ def score_person_entity(entity, context: ValidationContext) -> float:
     text_lower = text.lower()
 
     # Immediate rejects
-    if text_lower in _get_blocklist():
+    if text_lower in context.blocklist:
         return 0.0
     if text in context.non_person_labels:
         return 0.0
@@ -147,9 +174,7 @@ def score_person_entity(entity, context: ValidationContext) -> float:
         return 0.0
     if _is_certification(text):
         return 0.0
-    if '@' in text or '\n' in text:
-        return 0.0
-    if any(c.isdigit() for c in text):
+    if _NON_NAME_CHAR_RE.search(text):
         return 0.0
 
     score = 0.5
@@ -1,15 +1,21 @@
 """Watch input folder and process new files."""
 
-import json
+from __future__ import annotations
+
 import logging
+import os
 import re
 import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import repeat
 from pathlib import Path
 
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 
 from .config import (
     INPUT_DIR,
@@ -19,14 +25,24 @@ from .config import (
     OUTPUT_DIR,
     SUPPORTED_EXTENSIONS,
 )
-from .detector import detect_pii
+from .detector import detect_pii_batch
 from .extractor import extract_text
+from .mapping import save_mapping
 from .redactor import redact
 from .settings import Settings
 from .writers import write_output, write_txt
 
 logger = logging.getLogger("pii_buddy")
 
+# Let a dropped file sit this long without new events before processing it
+_SETTLE_SECONDS = 1.0
+# Extra wait after the first file settles, so files dropped together batch together
+_BATCH_WINDOW_SECONDS = 0.2
+# Threads used to read/extract files concurrently within one batch
+_EXTRACT_WORKERS = 4
+# How often the watch loop cleans up old originals
+_CLEANUP_INTERVAL_SECONDS = 60
+
 
 def _redact_filename(filename: str, person_map: dict) -> str:
     """
@@ -73,26 +89,91 @@ def _apply_tag(clean_name: str, settings: Settings) -> str:
 
 def process_file(filepath: Path, settings: Settings = None) -> bool:
     """Process a single file. Returns True on success."""
+    return process_files([filepath], settings)[0]
+
+
+def process_files(filepaths: list[Path], settings: Settings = None) -> list[bool]:
+    """Process several files, running spaCy over all of them in one batch.
+
+    Returns one success flag per input path, in the same order.
+    """
     if settings is None:
         settings = Settings.defaults()
 
+    results = [False] * len(filepaths)
+    pending = []  # (index, filepath, text)
+
+    # 1. Extract text — reads overlap in a small thread pool when batched,
+    # in which case long PDFs aren't also fanned out over processes
+    if len(filepaths) > 1:
+        workers = min(len(filepaths), _EXTRACT_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            texts = list(pool.map(_extract, filepaths, repeat(False)))
+    else:
+        texts = [_extract(filepath) for filepath in filepaths]
+
+    for i, (filepath, text) in enumerate(zip(filepaths, texts)):
+        if text is not None:
+            pending.append((i, filepath, text))
+
+    if not pending:
+        return results
+
+    # 2. Detect PII (one nlp.pipe() pass over the whole batch)
+    try:
+        batch_entities = _detect(settings, [text for _, _, text in pending])
+    except Exception as e:
+        if len(pending) == 1:
+            logger.error(f"  Error detecting PII: {e}", exc_info=True)
+            return results
+        # Don't let one bad document fail the whole batch: retry file by file
+        logger.warning(f"  Batch detection failed ({e}); retrying each file on its own")
+        batch_entities = []
+        for _, filepath, text in pending:
+            try:
+                batch_entities.append(_detect(settings, [text])[0])
+            except Exception as err:
+                logger.error(f"  Error detecting PII in {filepath.name}: {err}", exc_info=True)
+                batch_entities.append(None)
+
+    for (i, filepath, text), entities in zip(pending, batch_entities):
+        if entities is not None:
+            results[i] = _redact_and_save(filepath, text, entities, settings)
+    return results
+
+
+def _detect(settings: Settings, texts: list[str]) -> list[list]:
+    return detect_pii_batch(
+        texts,
+        model=settings.spacy_model,
+        gpu=settings.gpu,
+        regex_only=settings.regex_only,
+        jobs=settings.jobs,
+    )
+
+
+def _extract(filepath: Path, parallel: bool = True) -> str | None:
+    """Extract a file's text, or return None (and log why) if it can't be processed."""
     if filepath.suffix.lower() not in SUPPORTED_EXTENSIONS:
         logger.warning(f"Skipping unsupported file: {filepath.name}")
-        return False
+        return None
 
     logger.info(f"Processing: {filepath.name}")
-
     try:
-        input_suffix = filepath.suffix.lower()
+        text = extract_text(filepath, parallel)
+    except Exception as e:
+        logger.error(f"  Error processing {filepath.name}: {e}", exc_info=True)
+        return None
+    if not text.strip():
+        logger.warning(f"No text extracted from {filepath.name}")
+        return None
+    return text
 
-        # 1. Extract text
-        text = extract_text(filepath)
-        if not text.strip():
-            logger.warning(f"No text extracted from {filepath.name}")
-            return False
 
-        # 2. Detect PII
-        entities = detect_pii(text)
+def _redact_and_save(filepath: Path, text: str, entities: list, settings: Settings) -> bool:
+    """Redact one extracted file and write its output + mapping. Returns True on success."""
+    try:
+        input_suffix = filepath.suffix.lower()
         logger.info(f"  Found {len(entities)} PII entities")
 
         # 3. Redact
@@ -131,7 +212,12 @@ def process_file(filepath: Path, settings: Settings = None) -> bool:
         if settings.overwrite:
             # Overwrite mode: back up original, then write output to input location
             backup_dest = ORIGINALS_DIR / filepath.name
-            shutil.copy2(str(filepath), str(backup_dest))
+            # Copy beside it and rename over: an earlier --once run may
+            # have left a hard link to a user file here, which copying
+            # into would overwrite
+            backup_tmp = backup_dest.with_name(backup_dest.name + ".tmp")
+            shutil.copy2(str(filepath), str(backup_tmp))
+            os.replace(backup_tmp, backup_dest)
             logger.info(f"  Backup: originals/{filepath.name}")
 
             # Write in same format to the original file's location
@@ -172,10 +258,7 @@ def process_file(filepath: Path, settings: Settings = None) -> bool:
             "entities_found": len(entities),
         }
         mapping_path = MAPPINGS_DIR / f"{clean_name}.map.json"
-        mapping_path.write_text(
-            json.dumps(mapping, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        save_mapping(mapping, mapping_path)
         logger.info(f"  Mapping: {mapping_path.name}")
         logger.info("")
         logger.info("  How did we do? Rate this redaction:")
@@ -200,45 +283,89 @@ def cleanup_originals():
 
 
 class NewFileHandler(FileSystemEventHandler):
+    """Queue new input files; the watch loop drains them in batches."""
+
     def __init__(self, settings: Settings = None):
         super().__init__()
         self.settings = settings or Settings.defaults()
+        self._pending: dict[Path, float] = {}  # path -> time of last event
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+    def _enqueue(self, filepath: Path):
+        if filepath.suffix.lower() not in SUPPORTED_EXTENSIONS:
+            return
+        with self._lock:
+            self._pending[filepath] = time.monotonic()
+        self._wakeup.set()
+
+    def wait(self, timeout: float):
+        """Block until a new file is queued or timeout seconds pass."""
+        self._wakeup.wait(timeout)
+        self._wakeup.clear()
+
+    def seconds_until_ready(self) -> float | None:
+        """Time until the next queued file settles, or None if nothing is queued."""
+        with self._lock:
+            if not self._pending:
+                return None
+            oldest = min(self._pending.values())
+        return max(0.0, oldest + _SETTLE_SECONDS - time.monotonic())
 
     def on_created(self, event):
         if event.is_directory:
             return
-        filepath = Path(event.src_path)
-        if filepath.suffix.lower() not in SUPPORTED_EXTENSIONS:
-            return
-        # Small delay to let file finish writing
-        time.sleep(1)
-        process_file(filepath, self.settings)
+        self._enqueue(Path(event.src_path))
 
     def on_moved(self, event):
         """Also handle files moved into the folder."""
         if event.is_directory:
             return
-        filepath = Path(event.dest_path)
-        if filepath.suffix.lower() not in SUPPORTED_EXTENSIONS:
-            return
-        time.sleep(1)
-        process_file(filepath, self.settings)
+        self._enqueue(Path(event.dest_path))
+
+    def drain(self) -> list[Path]:
+        """Pop queued files that have had time to finish writing."""
+        now = time.monotonic()
+        with self._lock:
+            ready = [
+                path for path, seen in self._pending.items()
+                if now - seen >= _SETTLE_SECONDS
+            ]
+            for path in ready:
+                del self._pending[path]
+        return ready
 
 
 def watch(input_dir: Path = INPUT_DIR, settings: Settings = None):
     """Start watching the input directory. Blocks until interrupted."""
     handler = NewFileHandler(settings)
-    observer = Observer()
+    if handler.settings.watch_poll:
+        # Network drives (SMB/NFS) don't deliver native file events
+        observer = PollingObserver(timeout=handler.settings.watch_interval)
+    else:
+        observer = Observer()
     observer.schedule(handler, str(input_dir), recursive=False)
     observer.start()
     logger.info(f"Watching: {input_dir}")
     logger.info("Drop PDF, DOCX, or TXT files into the input folder.")
     logger.info("Press Ctrl+C to stop.\n")
 
+    # Sleep until a file is due or cleanup is — no polling while idle
+    last_cleanup = time.monotonic()
     try:
         while True:
-            time.sleep(60)
-            cleanup_originals()
+            timeout = max(0.0, last_cleanup + _CLEANUP_INTERVAL_SECONDS - time.monotonic())
+            until_ready = handler.seconds_until_ready()
+            if until_ready is not None:
+                timeout = min(timeout, until_ready + _BATCH_WINDOW_SECONDS)
+            handler.wait(timeout)
+
+            ready = handler.drain()
+            if ready:
+                process_files(ready, handler.settings)
+            if time.monotonic() - last_cleanup >= _CLEANUP_INTERVAL_SECONDS:
+                cleanup_originals()
+                last_cleanup = time.monotonic()
     except KeyboardInterrupt:
         observer.stop()
         logger.info("\nStopped.")
@@ -44,6 +44,9 @@ echo "Downloading spaCy language models..."
 .venv/bin/python -m spacy download en_core_web_md --quiet
 .venv/bin/python -m spacy download en_core_web_sm --quiet
 
+echo "Precompiling PII Buddy..."
+.venv/bin/python -m compileall -q main.py pii_buddy
+
 # Create working directories
 BUDDY_DIR="${PII_BUDDY_DIR:-$HOME/PII_Buddy}"
 mkdir -p "$BUDDY_DIR/input" "$BUDDY_DIR/output" "$BUDDY_DIR/mappings" "$BUDDY_DIR/originals" "$BUDDY_DIR/logs" "$BUDDY_DIR/blocklists"
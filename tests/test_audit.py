@@ -12,6 +12,8 @@ from pii_buddy.audit import (
     _check_possessive_references,
     _check_title_prefixed,
     _collect_known_names,
+    _is_already_tagged,
+    _tag_spans,
     audit_redacted,
 )
 
@@ -161,6 +163,26 @@ class TestPossessiveReferences:
         assert findings == []
 
 
+# -----------------------------------------------------------------------
+# _is_already_tagged
+# -----------------------------------------------------------------------
+class TestIsAlreadyTagged:
+    TEXT = "Hi <NAME AS>, mail <<EMAIL_1>> now."
+
+    def test_inside_tags(self):
+        spans = _tag_spans(self.TEXT)
+        assert _is_already_tagged(spans, 3, 12)      # <NAME AS>
+        assert _is_already_tagged(spans, 8, 10)      # within a tag
+        assert _is_already_tagged(spans, 0, 5)       # ends inside a tag
+        assert _is_already_tagged(spans, 25, 32)     # starts inside a tag
+
+    def test_outside_tags(self):
+        spans = _tag_spans(self.TEXT)
+        assert not _is_already_tagged(spans, 0, 3)   # ends at tag start
+        assert not _is_already_tagged(spans, 12, 18) # starts at tag end
+        assert not _is_already_tagged(_tag_spans("no tags"), 0, 2)
+
+
 # -----------------------------------------------------------------------
 # _collect_known_names
 # -----------------------------------------------------------------------
@@ -236,3 +258,13 @@ class TestAuditRedacted:
         """Empty text should return empty text."""
         patched, mapping = audit_redacted("", {"tags": {}, "persons": {}})
         assert patched == ""
+
+    def test_short_title_name_still_checked(self):
+        """'Dr Li' is the shortest text any finder can flag."""
+        patched, _ = audit_redacted("ask dr li or Dr Li", {"tags": {}, "persons": {}})
+        assert "Dr <NAME L>" in patched
+
+    def test_dotted_capital_i_match(self):
+        """IGNORECASE matches 'SMİTH' to 'Smith' though their casefolds differ."""
+        patched, _ = audit_redacted("Mr Smith met SMİTH", {"tags": {}, "persons": {}})
+        assert patched == "Mr <NAME S> met <NAME S>"
@@ -8,6 +8,7 @@ Written BEFORE implementation — will fail until main.py is updated.
 """
 
 import json
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -135,3 +136,180 @@ class TestArgparseFlagsExist:
                 main()
             except (SystemExit, Exception):
                 pass
+
+
+# -----------------------------------------------------------------------
+# --once with several files
+# -----------------------------------------------------------------------
+class TestOnceCommand:
+    def test_multiple_files_processed_in_one_batch(self, tmp_path):
+        """--once A B should copy both into input/ and process them together."""
+        src = tmp_path / "src"
+        src.mkdir()
+        files = [src / "a.txt", src / "b.txt"]
+        for f in files:
+            f.write_text("hello", encoding="utf-8")
+
+        with patch("sys.argv", ["main.py", "--once", *map(str, files), "--dir", str(tmp_path)]), \
+                patch("pii_buddy.watcher.process_files", return_value=[True, True]) as mock_process:
+            from main import main
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 0
+        mock_process.assert_called_once()
+        targets = mock_process.call_args[0][0]
+        assert [t.name for t in targets] == ["a.txt", "b.txt"]
+        assert all((tmp_path / "input" / t.name).exists() for t in targets)
+
+    def test_any_failure_exits_nonzero(self, tmp_path):
+        f = tmp_path / "a.txt"
+        f.write_text("hello", encoding="utf-8")
+        g = tmp_path / "b.txt"
+        g.write_text("hello", encoding="utf-8")
+
+        with patch("sys.argv", ["main.py", "--once", str(f), str(g), "--dir", str(tmp_path)]), \
+                patch("pii_buddy.watcher.process_files", return_value=[True, False]):
+            from main import main
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+
+    def test_duplicate_names_rejected(self, tmp_path):
+        """Two inputs sharing a file name would collide in input/, so refuse them."""
+        for d in ("a", "b"):
+            (tmp_path / d).mkdir()
+            (tmp_path / d / "report.txt").write_text(d, encoding="utf-8")
+        files = [tmp_path / "a" / "report.txt", tmp_path / "b" / "report.txt"]
+
+        with patch("sys.argv", ["main.py", "--once", *map(str, files), "--dir", str(tmp_path)]), \
+                patch("pii_buddy.watcher.process_files") as mock_process:
+            from main import main
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+        mock_process.assert_not_called()
+        assert [f.read_text(encoding="utf-8") for f in files] == ["a", "b"]
+
+    def test_file_already_in_input_not_copied(self, tmp_path):
+        """A file that already lives in input/ is processed where it is."""
+        (tmp_path / "input").mkdir()
+        f = tmp_path / "input" / "a.txt"
+        f.write_text("hello", encoding="utf-8")
+
+        with patch("sys.argv", ["main.py", "--once", str(f), "--dir", str(tmp_path)]), \
+                patch("os.link") as mock_link, \
+                patch("pii_buddy.watcher.process_files", return_value=[True]) as mock_process:
+            from main import main
+            with pytest.raises(SystemExit):
+                main()
+
+        mock_link.assert_not_called()
+        assert mock_process.call_args[0][0] == [tmp_path / "input" / "a.txt"]
+
+    def test_stale_input_link_not_written_through(self, tmp_path):
+        """Staging over a leftover input/ hard link leaves the linked file alone."""
+        (tmp_path / "input").mkdir()
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        a = tmp_path / "a" / "report.txt"
+        a.write_text("from a", encoding="utf-8")
+        b = tmp_path / "b" / "report.txt"
+        b.write_text("from b", encoding="utf-8")
+        os.link(a, tmp_path / "input" / "report.txt")
+
+        with patch("sys.argv", ["main.py", "--once", str(b), "--dir", str(tmp_path)]), \
+                patch("pii_buddy.watcher.process_files", return_value=[True]):
+            from main import main
+            with pytest.raises(SystemExit):
+                main()
+
+        assert a.read_text(encoding="utf-8") == "from a"
+        assert (tmp_path / "input" / "report.txt").read_text(encoding="utf-8") == "from b"
+
+
+class TestSetupLogging:
+    def test_idempotent(self):
+        """Repeated setup_logging() calls add exactly one handler."""
+        import logging
+        from pii_buddy.cli import setup_logging
+
+        setup_logging()
+        setup_logging()
+        assert len(logging.getLogger("pii_buddy").handlers) == 1
+
+
+# -----------------------------------------------------------------------
+# --restore
+# -----------------------------------------------------------------------
+class TestRestoreCommand:
+    @pytest.mark.parametrize("tag_args, name, expected", [
+        ([], "PII_FREE_memo.txt", "RESTORED_memo.txt"),
+        (["--tag", "CLEAN"], "CLEAN_memo.txt", "RESTORED_memo.txt"),
+        (["--tag", "CLEAN"], "PII_FREE_memo.txt", "RESTORED_memo.txt"),
+        ([], "memo_redacted.txt", "RESTORED_memo_redacted.txt"),
+    ])
+    def test_restored_filename(self, tmp_path, sample_mapping, tag_args, name, expected):
+        from pii_buddy.mapping import save_mapping
+
+        redacted = tmp_path / name
+        redacted.write_text("Hi <NAME AS>", encoding="utf-8")
+        mapping_path = tmp_path / "memo.map.json"
+        save_mapping(sample_mapping, mapping_path)
+
+        argv = ["main.py", "--restore", str(redacted), str(mapping_path), "--dir", str(tmp_path), *tag_args]
+        with patch("sys.argv", argv):
+            from main import main
+            main()
+
+        assert (tmp_path / expected).read_text(encoding="utf-8") == "Hi Atul Singh"
+
+
+# -----------------------------------------------------------------------
+# --paste
+# -----------------------------------------------------------------------
+class TestPasteCommand:
+    def test_reads_raw_utf8_stdin(self, tmp_path, capsys):
+        """--paste decodes stdin bytes as UTF-8 regardless of locale."""
+        import io
+
+        stdin = MagicMock()
+        stdin.buffer = io.BytesIO("Café owner: a@b.com\r\nbad \xff".encode("utf-8") + b"\xff")
+        argv = ["main.py", "--paste", "--regex-only", "--no-audit", "--dir", str(tmp_path)]
+        with patch("sys.argv", argv), patch("sys.stdin", stdin):
+            from main import main
+            main()
+
+        out = capsys.readouterr().out
+        assert "Café owner: <<EMAIL_1>>\nbad \xff�" in out
+
+    def test_blank_stdin_exits(self, tmp_path):
+        import io
+
+        stdin = MagicMock()
+        stdin.buffer = io.BytesIO(b"  \n ")
+        with patch("sys.argv", ["main.py", "--paste", "--dir", str(tmp_path)]), patch("sys.stdin", stdin):
+            from main import main
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+        assert exc_info.value.code == 1
+
+
+# -----------------------------------------------------------------------
+# --subscribe
+# -----------------------------------------------------------------------
+class TestSubscribeCommand:
+    def _subscribe(self, email, tmp_path):
+        with patch("sys.argv", ["main.py", "--subscribe", email, "--dir", str(tmp_path)]):
+            from main import main
+            main()
+
+    def test_dedupes_whole_emails(self, tmp_path):
+        """a@x.com is a new subscriber even if ba@x.com is already stored."""
+        for email in ("ba@x.com", "a@x.com", "a@x.com"):
+            self._subscribe(email, tmp_path)
+
+        lines = (tmp_path / "feedback" / "pending_subscriptions.txt").read_text().splitlines()
+        assert [line.split("\t")[0] for line in lines] == ["ba@x.com", "a@x.com"]
@@ -9,6 +9,8 @@ Tests cover:
 
 import json
 import logging
+import os
+import re
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -161,3 +163,571 @@ class TestSettingsResolution:
             cli_verify_key=None,
         )
         assert settings.verify_enabled is False
+
+    def test_edited_config_is_reread(self, tmp_path):
+        """Cached settings.conf values are dropped once the file changes."""
+        import os
+        from pii_buddy.settings import load_config_file
+
+        conf = tmp_path / "settings.conf"
+        conf.write_text("[output]\ntag = FIRST\n")
+        values = load_config_file(tmp_path)
+        assert values == {"tag": "FIRST"}
+
+        values["tag"] = "mutated"
+        assert load_config_file(tmp_path) == {"tag": "FIRST"}
+
+        conf.write_text("[output]\ntag = SECOND\n")
+        mtime = conf.stat().st_mtime_ns + 1_000_000_000
+        os.utime(conf, ns=(mtime, mtime))
+        assert load_config_file(tmp_path) == {"tag": "SECOND"}
+
+
+# -----------------------------------------------------------------------
+# Batched detection
+# -----------------------------------------------------------------------
+class TestBatchDetection:
+    @pytest.fixture(autouse=True)
+    def blank_nlp(self, monkeypatch):
+        """Use a blank spaCy pipeline so tests don't need a downloaded model."""
+        import spacy
+        from pii_buddy import detector
+
+        monkeypatch.setattr(detector, "_nlp", spacy.blank("en"))
+
+    def test_batch_matches_single(self):
+        """detect_pii_batch should return the same entities as detect_pii per text."""
+        from pii_buddy.detector import detect_pii, detect_pii_batch
+
+        texts = [
+            "Email steve@example.com or call (555) 867-5309.",
+            "No PII here at all.",
+            "SSN 123-45-6789, born 03/15/1988.",
+        ]
+        batch = detect_pii_batch(texts)
+        assert len(batch) == len(texts)
+        for text, entities in zip(texts, batch):
+            assert entities == detect_pii(text)
+        assert [e.label for e in batch[0]] == ["EMAIL", "PHONE"]
+        assert batch[1] == []
+
+    def test_empty_batch(self):
+        from pii_buddy.detector import detect_pii_batch
+
+        assert detect_pii_batch([]) == []
+
+
+class TestWatchQueue:
+    def test_drain_waits_for_settle(self, monkeypatch, tmp_path):
+        """Queued files are only drained once they've stopped changing."""
+        from pii_buddy import watcher
+
+        handler = watcher.NewFileHandler()
+        handler._enqueue(tmp_path / "a.txt")
+        handler._enqueue(tmp_path / "ignored.png")
+        assert handler.drain() == []
+
+        assert 0 < handler.seconds_until_ready() <= watcher._SETTLE_SECONDS
+
+        monkeypatch.setattr(watcher, "_SETTLE_SECONDS", 0)
+        assert handler.seconds_until_ready() == 0
+        assert handler.drain() == [tmp_path / "a.txt"]
+        assert handler.drain() == []
+        assert handler.seconds_until_ready() is None
+
+    def test_enqueue_wakes_waiter(self, tmp_path):
+        import threading
+        from pii_buddy import watcher
+
+        handler = watcher.NewFileHandler()
+        threading.Timer(0.05, handler._enqueue, args=[tmp_path / "a.txt"]).start()
+        handler.wait(5)
+        assert handler.seconds_until_ready() is not None
+
+
+# -----------------------------------------------------------------------
+# Mapping files
+# -----------------------------------------------------------------------
+class TestMappingFiles:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, sample_mapping, tmp_path, monkeypatch, use_orjson):
+        """Mappings survive save/load with or without orjson, keeping non-ASCII text."""
+        from pii_buddy import mapping as mapping_io
+
+        if not use_orjson:
+            monkeypatch.setattr(mapping_io, "orjson", None)
+        data = dict(sample_mapping, metadata={"original_file": "José_Núñez.txt"})
+        path = tmp_path / "test.map.json"
+
+        mapping_io.save_mapping(data, path)
+
+        assert mapping_io.load_mapping(path) == data
+        assert "José_Núñez" in path.read_text(encoding="utf-8")
+        assert json.loads(path.read_text(encoding="utf-8")) == data
+
+    def test_save_replaces_atomically(self, sample_mapping, tmp_path):
+        """Saving over an existing mapping leaves no temp file behind."""
+        from pii_buddy.mapping import load_mapping, save_mapping
+
+        path = tmp_path / "test.map.json"
+        path.write_text("{}", encoding="utf-8")
+
+        save_mapping(sample_mapping, path)
+
+        assert load_mapping(path) == sample_mapping
+        assert [p.name for p in tmp_path.iterdir()] == ["test.map.json"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+    def test_saved_mapping_is_owner_only(self, sample_mapping, tmp_path):
+        """Mappings contain the original PII, so other users can't read them."""
+        from pii_buddy.mapping import save_mapping
+
+        path = tmp_path / "test.map.json"
+        save_mapping(sample_mapping, path)
+
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_restore_reads_saved_mapping(self, sample_mapping, tmp_path):
+        from pii_buddy.mapping import save_mapping
+        from pii_buddy.restorer import restore
+
+        path = tmp_path / "test.map.json"
+        save_mapping(sample_mapping, path)
+
+        assert restore("Hi <NAME AS> and <NAME RM>", path) == "Hi Atul Singh and Robert Merrill"
+
+    def test_restore_with_preloaded_mapping(self, tmp_path):
+        """A mapping the caller already loaded is used as-is, in one pass."""
+        from pii_buddy.restorer import restore
+
+        mapping = {"tags": {"<<EMAIL_1>>": "a@x.com", "<<EMAIL_11>>": "k@x.com"}}
+        text = "<<EMAIL_11>>, <<EMAIL_1>>, <<EMAIL_2>>"
+
+        restored = restore(text, tmp_path / "missing.map.json", mapping)
+        assert restored == "k@x.com, a@x.com, <<EMAIL_2>>"
+
+    @pytest.mark.parametrize("chunk_chars", [1, 7, 1 << 20])
+    def test_restore_file_matches_restore(self, sample_mapping, tmp_path, monkeypatch, chunk_chars):
+        """Streaming restore gives the same text whatever the chunk size."""
+        from pii_buddy import restorer
+
+        monkeypatch.setattr(restorer, "RESTORE_CHUNK_CHARS", chunk_chars)
+        text = "Hi <NAME AS>,\r\n<NAME RM> and <NAME AS> met <NAME X>. " * 5
+        src = tmp_path / "PII_FREE_note.txt"
+        src.write_bytes(text.encode("utf-8"))
+        out = tmp_path / "RESTORED_note.txt"
+
+        restorer.restore_file(src, out, tmp_path / "unused.map.json", sample_mapping)
+
+        expected = restorer.restore(text.replace("\r\n", "\n"), None, sample_mapping)
+        assert out.read_text(encoding="utf-8") == expected
+
+
+class TestProcessFiles:
+    def test_batch_writes_each_file(self, tmp_path, monkeypatch, default_settings):
+        """process_files handles a multi-file batch and reports per-file success."""
+        import spacy
+        from pii_buddy import detector, watcher
+
+        monkeypatch.setattr(detector, "_nlp", spacy.blank("en"))
+        for name in ("MAPPINGS_DIR", "ORIGINALS_DIR"):
+            (tmp_path / name).mkdir()
+            monkeypatch.setattr(watcher, name, tmp_path / name)
+        default_settings.output_dir = tmp_path / "out"
+        default_settings.output_dir.mkdir()
+
+        good = tmp_path / "a.txt"
+        good.write_text("Reach me at steve@example.com", encoding="utf-8")
+        empty = tmp_path / "b.txt"
+        empty.write_text("   ", encoding="utf-8")
+        other = tmp_path / "c.txt"
+        other.write_text("Call (555) 867-5309", encoding="utf-8")
+
+        results = watcher.process_files([good, empty, other], default_settings)
+
+        assert results == [True, False, True]
+        out = (default_settings.output_dir / "PII_FREE_a.txt").read_text(encoding="utf-8")
+        assert out == "Reach me at <<EMAIL_1>>"
+        assert (tmp_path / "MAPPINGS_DIR" / "c.map.json").exists()
+
+    def test_detection_error_fails_only_that_file(self, tmp_path, monkeypatch, default_settings):
+        """A document that breaks batched detection doesn't take the batch down with it."""
+        import spacy
+        from pii_buddy import detector, watcher
+
+        monkeypatch.setattr(detector, "_nlp", spacy.blank("en"))
+        for name in ("MAPPINGS_DIR", "ORIGINALS_DIR"):
+            (tmp_path / name).mkdir()
+            monkeypatch.setattr(watcher, name, tmp_path / name)
+        default_settings.output_dir = tmp_path / "out"
+        default_settings.output_dir.mkdir()
+
+        def detect(texts, **kwargs):
+            if any("BOOM" in text for text in texts):
+                raise RuntimeError("bad document")
+            return detector.detect_pii_batch(texts, **kwargs)
+
+        monkeypatch.setattr(watcher, "detect_pii_batch", detect)
+        good = tmp_path / "a.txt"
+        good.write_text("Reach me at steve@example.com", encoding="utf-8")
+        bad = tmp_path / "b.txt"
+        bad.write_text("BOOM", encoding="utf-8")
+
+        assert watcher.process_files([good, bad], default_settings) == [True, False]
+        assert bad.exists()
+
+    def test_overwrite_backup_replaces_stale_link(self, tmp_path, monkeypatch, default_settings):
+        """The --overwrite backup never writes through a hard link left in originals/."""
+        import spacy
+        from pii_buddy import detector, watcher
+
+        monkeypatch.setattr(detector, "_nlp", spacy.blank("en"))
+        for name in ("MAPPINGS_DIR", "ORIGINALS_DIR"):
+            (tmp_path / name).mkdir()
+            monkeypatch.setattr(watcher, name, tmp_path / name)
+        default_settings.overwrite = True
+        default_settings.output_format = "same"
+
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        earlier = tmp_path / "a" / "report.txt"
+        earlier.write_text("Mail steve@example.com", encoding="utf-8")
+        os.link(earlier, tmp_path / "ORIGINALS_DIR" / "report.txt")
+        target = tmp_path / "b" / "report.txt"
+        target.write_text("Mail mary@example.com", encoding="utf-8")
+
+        assert watcher.process_files([target], default_settings) == [True]
+
+        assert earlier.read_text(encoding="utf-8") == "Mail steve@example.com"
+        backup = tmp_path / "ORIGINALS_DIR" / "report.txt"
+        assert backup.read_text(encoding="utf-8") == "Mail mary@example.com"
+        assert target.read_text(encoding="utf-8") == "Mail <<EMAIL_1>>"
+
+
+class TestDetectionSettings:
+    def test_model_defaults_to_auto(self):
+        from pathlib import Path
+        from pii_buddy.settings import resolve_settings
+
+        settings = resolve_settings(base_dir=Path("/tmp/test"))
+        assert settings.spacy_model == ""
+        assert settings.gpu is False
+
+    def test_cli_model_overrides_config(self, tmp_path):
+        from pii_buddy.settings import resolve_settings
+
+        (tmp_path / "settings.conf").write_text("[detection]\nmodel = lg\ngpu = true\n")
+
+        settings = resolve_settings(base_dir=tmp_path, cli_model="sm")
+        assert settings.spacy_model == "sm"
+        assert settings.gpu is True
+
+    def test_unknown_model_ignored(self, tmp_path):
+        from pii_buddy.settings import resolve_settings
+
+        (tmp_path / "settings.conf").write_text("[detection]\nmodel = huge\n")
+
+        assert resolve_settings(base_dir=tmp_path).spacy_model == ""
+
+    def test_jobs_caps_spacy_processes(self, tmp_path, monkeypatch):
+        from pii_buddy import detector
+        from pii_buddy.settings import resolve_settings
+
+        (tmp_path / "settings.conf").write_text("[detection]\njobs = 3\n")
+        assert resolve_settings(base_dir=tmp_path).jobs == 3
+        assert resolve_settings(base_dir=tmp_path, cli_jobs=-2).jobs == 0
+
+        monkeypatch.setattr(detector.os, "cpu_count", lambda: 16)
+        many = 100 * detector.SPACY_BATCH_SIZE
+        assert detector._spacy_processes(many) == 8
+        assert detector._spacy_processes(many, jobs=3) == 3
+        assert detector._spacy_processes(detector.SPACY_BATCH_SIZE, jobs=3) == 1
+
+    def test_regex_only_skips_spacy(self, monkeypatch):
+        """--regex-only finds structured PII without ever loading spaCy."""
+        from pii_buddy import detector
+
+        def fail(*args, **kwargs):
+            raise AssertionError("spaCy should not be loaded")
+
+        monkeypatch.setattr(detector, "get_nlp", fail)
+        entities = detector.detect_pii(
+            "Steve Johnson, steve@example.com, 123-45-6789", regex_only=True
+        )
+        assert [e.label for e in entities] == ["EMAIL", "SSN"]
+
+    def test_prewarm_loads_once(self, monkeypatch):
+        """A get_nlp() racing the background prewarm reuses its pipeline."""
+        import threading
+        from pii_buddy import detector
+
+        loads = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_load(model="", gpu=False):
+            loads.append(model)
+            started.set()
+            release.wait(5)
+            return object()
+
+        monkeypatch.setattr(detector, "_nlp", None)
+        monkeypatch.setattr(detector, "_load_spacy", slow_load)
+        detector.prewarm_nlp_async()
+        assert started.wait(5)
+        release.set()
+        nlp = detector.get_nlp()
+        assert detector.get_nlp() is nlp
+        assert loads == [""]
+
+    def test_gpu_change_reloads_pipeline(self, monkeypatch):
+        """Toggling gpu in settings.conf takes effect without a restart."""
+        from pii_buddy import detector
+
+        loads = []
+        monkeypatch.setattr(detector, "_nlp", None)
+        monkeypatch.setattr(detector, "_nlp_key", ("", False))
+        monkeypatch.setattr(detector, "_load_spacy", lambda model, gpu: loads.append(gpu) or object())
+
+        cpu = detector.get_nlp("sm")
+        assert detector.get_nlp("sm") is cpu
+        assert detector.get_nlp("sm", gpu=True) is not cpu
+        assert loads == [False, True]
+
+
+class TestWatchSettings:
+    def test_native_events_by_default(self):
+        from pathlib import Path
+        from pii_buddy.settings import resolve_settings
+
+        settings = resolve_settings(base_dir=Path("/tmp/test"))
+        assert settings.watch_poll is False
+        assert settings.watch_interval == 1.0
+
+    def test_cli_interval_implies_poll(self, tmp_path):
+        from pii_buddy.settings import resolve_settings
+
+        (tmp_path / "settings.conf").write_text("[watch]\ninterval = 2.5\n")
+
+        assert resolve_settings(base_dir=tmp_path).watch_poll is False
+        settings = resolve_settings(base_dir=tmp_path, cli_watch_interval=5)
+        assert settings.watch_poll is True
+        assert settings.watch_interval == 5
+
+
+class TestReadTextFile:
+    @pytest.mark.parametrize("threshold", [0, 1 << 30])
+    def test_matches_read_text(self, tmp_path, monkeypatch, threshold):
+        """Memory-mapped and regular reads give the same text, newlines included."""
+        from pii_buddy import extractor
+
+        monkeypatch.setattr(extractor, "MMAP_THRESHOLD", threshold)
+        path = tmp_path / "doc.txt"
+        path.write_bytes("José\r\nline two\rthree\n".encode("utf-8"))
+
+        assert extractor.read_text_file(path) == path.read_text(encoding="utf-8")
+
+
+class TestPdfExtraction:
+    def test_small_pdf_opened_once(self, tmp_path, monkeypatch):
+        """Below the sharding threshold one open serves the page count and the text."""
+        from fpdf import FPDF
+        from pii_buddy import extractor
+
+        pdf = FPDF()
+        pdf.set_font("helvetica", size=12)
+        pdf.add_page()
+        pdf.cell(text="Only page")
+        path = tmp_path / "doc.pdf"
+        pdf.output(str(path))
+
+        opens = []
+        open_pdf = extractor._open_pdf
+        monkeypatch.setattr(extractor, "_open_pdf", lambda p: opens.append(p) or open_pdf(p))
+
+        assert extractor.extract_text(path) == "Only page"
+        assert opens == [path]
+
+    def test_pdf_pages_split_across_workers(self, tmp_path, monkeypatch):
+        """Sharded PDF extraction keeps page order and skips blank pages."""
+        from fpdf import FPDF
+        from pii_buddy import extractor
+
+        pdf = FPDF()
+        pdf.set_font("helvetica", size=12)
+        for text in ("Page one", "", "Page three", "Page four", "Page five"):
+            pdf.add_page()
+            if text:
+                pdf.cell(text=text)
+        path = tmp_path / "doc.pdf"
+        pdf.output(str(path))
+
+        serial = extractor.extract_text(path)
+        monkeypatch.setattr(extractor, "PDF_PAGES_PER_WORKER", 2)
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+
+        assert serial == "Page one\n\nPage three\n\nPage four\n\nPage five"
+        assert extractor.extract_text(path) == serial
+
+    def test_no_sharding_when_not_parallel(self, tmp_path, monkeypatch):
+        """Batched extraction already runs in threads, so it doesn't start a process pool too."""
+        from fpdf import FPDF
+        from pii_buddy import extractor
+
+        pdf = FPDF()
+        pdf.set_font("helvetica", size=12)
+        for n in range(4):
+            pdf.add_page()
+            pdf.cell(text=f"Page {n}")
+        path = tmp_path / "doc.pdf"
+        pdf.output(str(path))
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("no worker processes expected")
+
+        monkeypatch.setattr(extractor, "PDF_PAGES_PER_WORKER", 1)
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        monkeypatch.setattr(extractor, "ProcessPoolExecutor", no_pool)
+
+        text = extractor.extract_text(path, parallel=False)
+        assert text == "Page 0\n\nPage 1\n\nPage 2\n\nPage 3"
+
+
+class TestRegexCompile:
+    def test_lookaround_patterns_fall_back_to_re(self):
+        """Patterns RE2 can't express still compile (via stdlib re)."""
+        import re
+        from pii_buddy.detector import _compile
+
+        assert isinstance(_compile(r"(?<!\d)\d{3}(?!\d)"), re.Pattern)
+
+    def test_matches_stdlib_re(self):
+        """Whichever engine is used, the structured-PII patterns find the same spans."""
+        import re
+        from pii_buddy.detector import REGEX_PATTERNS
+
+        text = (
+            "Email steve@example.com, call (555) 867-5309, SSN 123-45-6789, "
+            "born March 5, 1990, ID D1234567, at 123 Oak Street, Apt 4B "
+            "https://linkedin.com/in/steve"
+        )
+        for pattern, label in REGEX_PATTERNS:
+            flags = re.IGNORECASE if label in ("DOB", "ADDRESS") else 0
+            expected = [m.span() for m in re.finditer(pattern.pattern, text, flags)]
+            assert [m.span() for m in pattern.finditer(text)] == expected, label
+
+    def test_phone_run_scan_matches_full_scan(self):
+        """Scanning only digit/separator runs finds the same phone numbers."""
+        from pii_buddy.detector import PHONE_RE, _detect_regex
+
+        text = (
+            "call (555) 867-5309 or +1 555.867.5310\n5558675311, "
+            "not 12345678901234 or 555-867-53099; fax 1 555 867 5312"
+        )
+        expected = [m.span() for m in PHONE_RE.finditer(text)]
+        found = [(e.start, e.end) for e in _detect_regex(text) if e.label == "PHONE"]
+        assert found == expected and len(found) == 4
+
+
+class TestNerSkip:
+    def test_lowercase_text_skips_spacy(self, monkeypatch):
+        """Text with no capitals gets the regex pass without loading spaCy."""
+        from pii_buddy import detector
+
+        def fail(*args, **kwargs):
+            raise AssertionError("spaCy should not be loaded")
+
+        monkeypatch.setattr(detector, "get_nlp", fail)
+        entities = detector.detect_pii("ping me at steve@example.com tomorrow")
+        assert [e.label for e in entities] == ["EMAIL"]
+
+    def test_wordless_text_skips_spacy(self, monkeypatch):
+        """Capitals alone aren't enough: a form of codes and numbers has no names."""
+        from pii_buddy import detector
+
+        def fail(*args, **kwargs):
+            raise AssertionError("spaCy should not be loaded")
+
+        monkeypatch.setattr(detector, "get_nlp", fail)
+        entities = detector.detect_pii("A1 B2 C3\n#1: 123-45-6789")
+        assert [e.label for e in entities] == ["SSN"]
+
+    def test_mixed_batch_keeps_order(self, monkeypatch):
+        import spacy
+        from pii_buddy import detector
+
+        monkeypatch.setattr(detector, "_nlp", spacy.blank("en"))
+        batch = detector.detect_pii_batch([
+            "Email Steve at steve@example.com",
+            "call (555) 867-5309",
+            "Nothing here",
+        ])
+        assert [[e.label for e in ents] for ents in batch] == [["EMAIL"], ["PHONE"], []]
+
+
+class TestBlocklistCache:
+    def test_reloads_when_file_changes(self, tmp_path, monkeypatch):
+        """Edits to a blocklist file are picked up without reload_blocklist()."""
+        import os
+        from pii_buddy import validation
+
+        user_bl = tmp_path / "user_blocklist.txt"
+        user_bl.write_text("Acme Corp\n", encoding="utf-8")
+        monkeypatch.setattr(validation, "_BLOCKLIST_FILES", (user_bl,))
+        monkeypatch.setattr(validation, "_blocklist_cache", None)
+
+        assert validation._get_blocklist() == {"acme corp"}
+
+        user_bl.write_text("Acme Corp\nGlobex\n", encoding="utf-8")
+        stat = user_bl.stat()
+        os.utime(user_bl, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert validation._get_blocklist() == {"acme corp", "globex"}
+
+
+class TestRedact:
+    def test_entities_and_missed_references(self):
+        """Entities are tagged in place; untagged name parts are caught after."""
+        from pii_buddy.detector import PIIEntity
+        from pii_buddy.redactor import redact
+
+        text = "Steve Johnson (steve@co.com) met Johnson. STEVE agreed."
+        entities = [
+            PIIEntity("Steve Johnson", "PERSON", 0, 13),
+            PIIEntity("steve@co.com", "EMAIL", 15, 27),
+        ]
+
+        redacted, mapping = redact(text, entities)
+
+        assert redacted == "<NAME SJ> (<<EMAIL_1>>) met <NAME SJ>. <NAME SJ> agreed."
+        assert mapping["tags"] == {"<NAME SJ>": "Steve Johnson", "<<EMAIL_1>>": "steve@co.com"}
+
+    @pytest.mark.parametrize("text", [
+        "José Núñez, JOSÉ and núñez; Steve STEVEN steve",
+        "Steve met SMİTH and smith",  # re-only case folding
+    ])
+    def test_replace_all_same_with_or_without_re2(self, text, monkeypatch):
+        from pii_buddy import detector
+        from pii_buddy.redactor import _replace_all
+
+        pairs = [("Steve", "<S>"), ("José Núñez", "<JN>"), ("José", "<J>"),
+                 ("Núñez", "<N>"), ("Smith", "<SM>")]
+        fast = _replace_all(text, pairs, re.IGNORECASE)
+        monkeypatch.setattr(detector, "re2", None)
+        assert fast == _replace_all(text, pairs, re.IGNORECASE)
+
+
+class TestFeedbackLog:
+    def test_load_newest_first_and_skips_bad_lines(self, tmp_path, monkeypatch):
+        from pii_buddy import feedback
+
+        monkeypatch.setattr(feedback, "FEEDBACK_DIR", tmp_path)
+        for rating in (1, 2, 3):
+            feedback.record_rating(rating, comment="ok ✓")
+        with open(tmp_path / "feedback.jsonl", "a", encoding="utf-8") as f:
+            f.write("not json\n\n")
+        feedback.record_rating(4)
+
+        entries = feedback.load_feedback(limit=3)
+        assert [e["rating"] for e in entries] == [4, 3, 2]
+        assert entries[1]["comment"] == "ok ✓"
+        assert feedback.feedback_summary()["rated"] == 4